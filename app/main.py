@@ -5,17 +5,42 @@ Modern Intellectual Property Management System with migration capabilities
 """
 
 from fastapi import FastAPI, Request, Depends, HTTPException, BackgroundTasks
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+from jinja2 import FileSystemBytecodeCache
 import uvicorn
 from pathlib import Path
+import asyncio
+import heapq
 import json
+import math
+import os
+import time
+import numpy as np
 import pandas as pd
-from datetime import datetime
-from typing import Dict, List, Any, Optional
+from datetime import date, datetime
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple, Union
+from contextlib import asynccontextmanager
+from functools import wraps
+from itertools import islice
 import logging
 
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow
+    import pyarrow.compute
+    import pyarrow.csv
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -26,24 +51,43 @@ TEMPLATES_DIR = ROOT / "app" / "templates"
 STATIC_DIR = ROOT / "app" / "static"
 DATA_DIR = ROOT / "data" / "legacy_csv"
 VALIDATION_REPORTS_DIR = ROOT / "data" / "validation_reports"
+TEMPLATE_CACHE_DIR = ROOT / ".jinja_cache"
 
 # Create directories if they don't exist
 TEMPLATES_DIR.mkdir(parents=True, exist_ok=True)
 STATIC_DIR.mkdir(parents=True, exist_ok=True)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up the on-disk template cache at startup, not when the module is imported"""
+    # Compiled templates are cached on disk so restarts skip re-parsing them.
+    # Set TEMPLATE_AUTO_RELOAD=0 in production to stop checking sources for edits.
+    TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    templates.env.bytecode_cache = FileSystemBytecodeCache(directory=str(TEMPLATE_CACHE_DIR))
+    templates.env.auto_reload = os.getenv("TEMPLATE_AUTO_RELOAD", "1") == "1"
+    for template_file in TEMPLATES_DIR.glob("*.html"):
+        templates.env.get_template(template_file.name)
+    yield
+
 # Create FastAPI app
 app = FastAPI(
+    lifespan=lifespan,
     title="IPMS - Intellectual Property Management System",
     description="Modern IPMS with legacy data migration capabilities",
     version="1.0.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse
 )
 
+# Compress larger responses; list payloads repeat the same field names and
+# status strings and shrink several-fold
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Mount static files
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
-# Templates
+# Templates (the bytecode cache is attached in lifespan)
 templates = Jinja2Templates(directory=TEMPLATES_DIR)
 
 # Import ETL modules
@@ -78,73 +122,50 @@ async def dashboard(request: Request):
 @app.get("/clients", response_class=HTMLResponse)
 async def clients_page(request: Request):
     """Clients management page"""
-    clients_data = await load_csv_data("clients.csv")
+    clients_table = await load_table("clients.csv")
     
     return templates.TemplateResponse("clients.html", {
         "request": request,
-        "clients": clients_data.to_dict('records') if clients_data is not None else [],
+        "clients": table_records(clients_table["cols"]) if clients_table is not None else [],
         "title": "Client Management"
     })
 
 @app.get("/patents", response_class=HTMLResponse)
 async def patents_page(request: Request):
     """Patents management page"""
-    patents_data = await load_csv_data("patents.csv")
+    patents_table = await load_table("patents.csv")
     
     return templates.TemplateResponse("patents.html", {
         "request": request,
-        "patents": patents_data.to_dict('records') if patents_data is not None else [],
+        "patents": table_records(patents_table["cols"]) if patents_table is not None else [],
         "title": "Patent Portfolio"
     })
 
 @app.get("/trademarks", response_class=HTMLResponse)
 async def trademarks_page(request: Request):
     """Trademarks management page"""
-    trademarks_data = await load_csv_data("trademarks.csv")
+    trademarks_table = await load_table("trademarks.csv")
     
     return templates.TemplateResponse("trademarks.html", {
         "request": request,
-        "trademarks": trademarks_data.to_dict('records') if trademarks_data is not None else [],
+        "trademarks": table_records(trademarks_table["cols"]) if trademarks_table is not None else [],
         "title": "Trademark Portfolio"
     })
 
 @app.get("/deadlines", response_class=HTMLResponse)
 async def deadlines_page(request: Request):
     """Deadlines management page"""
-    deadlines_data = await load_csv_data("deadlines.csv")
+    deadlines_table = await load_table("deadlines.csv")
     
     # Filter upcoming deadlines
-    if deadlines_data is not None:
+    if deadlines_table is not None:
         # Sort by due date
-        deadlines_data = deadlines_data.sort_values('due_date')
+        deadlines_data = deadlines_table["df"].sort_values('due_date')
         
-        # Add urgency classification
-        today = datetime.now().date()
-        deadlines_records = []
-        
-        for _, row in deadlines_data.iterrows():
-            record = row.to_dict()
-            try:
-                due_date = pd.to_datetime(record['due_date']).date()
-                days_until = (due_date - today).days
-                
-                if days_until < 0:
-                    record['urgency'] = 'overdue'
-                elif days_until <= 7:
-                    record['urgency'] = 'critical'
-                elif days_until <= 30:
-                    record['urgency'] = 'high'
-                elif days_until <= 90:
-                    record['urgency'] = 'medium'
-                else:
-                    record['urgency'] = 'low'
-                
-                record['days_until'] = days_until
-            except:
-                record['urgency'] = 'unknown'
-                record['days_until'] = None
-            
-            deadlines_records.append(record)
+        # Add urgency classification (both series align on the original index)
+        urgency, days_until, _ = _deadline_urgency_index(deadlines_table)
+        deadlines_data = deadlines_data.assign(urgency=urgency, days_until=days_until)
+        deadlines_records = fast_records(deadlines_data)
     else:
         deadlines_records = []
     
@@ -154,6 +175,43 @@ async def deadlines_page(request: Request):
         "title": "Deadlines & Renewals"
     })
 
+URGENCY_LEVELS = ('overdue', 'critical', 'high', 'medium', 'low', 'unknown')
+
+def classify_deadline_urgency(due_dates: pd.Series, today: Optional[date] = None) -> Tuple[np.ndarray, pd.Series]:
+    """Classify due dates into urgency buckets relative to today
+
+    Returns the urgency label per row and the days until each due date
+    (None where the date cannot be parsed, which is labelled 'unknown').
+    """
+    today = np.datetime64(today or datetime.now().date(), 'D')
+    parsed = pd.to_datetime(due_dates, format='mixed', errors='coerce')
+    known = parsed.notna().to_numpy()
+    days_until = (parsed.to_numpy().astype('datetime64[D]') - today).astype(np.int64)
+    
+    urgency = np.select(
+        [~known, days_until < 0, days_until <= 7, days_until <= 30, days_until <= 90],
+        ['unknown', 'overdue', 'critical', 'high', 'medium'],
+        default='low'
+    )
+    days = pd.Series(days_until, index=due_dates.index, dtype=object).where(known, None)
+    return urgency, days
+
+def _deadline_urgency_index(table: Dict[str, Any]) -> Tuple[pd.Series, pd.Series, Dict[str, np.ndarray]]:
+    """Urgency per deadline plus the row positions in each urgency bucket
+
+    Kept on the cached deadlines table and recomputed once a day, since
+    urgency is relative to today's date.
+    """
+    today = datetime.now().date()
+    cached = table["urgency"]
+    if today not in cached:
+        data = table["df"]
+        urgency, days_until = classify_deadline_urgency(data['due_date'], today)
+        buckets = {level: np.flatnonzero(urgency == level) for level in URGENCY_LEVELS}
+        cached.clear()
+        cached[today] = (pd.Series(urgency, index=data.index), days_until, buckets)
+    return cached[today]
+
 @app.get("/migration", response_class=HTMLResponse)
 async def migration_page(request: Request):
     """Migration management page"""
@@ -220,68 +278,389 @@ async def api_generate_data(background_tasks: BackgroundTasks):
 @app.get("/api/clients")
 async def api_get_clients(limit: int = 100, offset: int = 0):
     """Get clients data"""
-    clients_data = await load_csv_data("clients.csv")
-    if clients_data is None:
+    clients_table = await load_table("clients.csv")
+    if clients_table is None:
         return {"clients": [], "total": 0}
     
-    total = len(clients_data)
-    clients = clients_data.iloc[offset:offset+limit].to_dict('records')
+    total = len(clients_table["df"])
+    clients = _records_window(clients_table, offset, limit)
     
-    return {"clients": clients, "total": total, "limit": limit, "offset": offset}
+    return stream_list_response("clients", clients, total=total, limit=limit, offset=offset)
 
 @app.get("/api/patents")
 async def api_get_patents(limit: int = 100, offset: int = 0):
     """Get patents data"""
-    patents_data = await load_csv_data("patents.csv")
-    if patents_data is None:
+    patents_table = await load_table("patents.csv")
+    if patents_table is None:
         return {"patents": [], "total": 0}
     
-    total = len(patents_data)
-    patents = patents_data.iloc[offset:offset+limit].to_dict('records')
+    total = len(patents_table["df"])
+    patents = _records_window(patents_table, offset, limit)
     
-    return {"patents": patents, "total": total, "limit": limit, "offset": offset}
+    return stream_list_response("patents", patents, total=total, limit=limit, offset=offset)
 
 @app.get("/api/trademarks")
 async def api_get_trademarks(limit: int = 100, offset: int = 0):
     """Get trademarks data"""
-    trademarks_data = await load_csv_data("trademarks.csv")
-    if trademarks_data is None:
+    trademarks_table = await load_table("trademarks.csv")
+    if trademarks_table is None:
         return {"trademarks": [], "total": 0}
     
-    total = len(trademarks_data)
-    trademarks = trademarks_data.iloc[offset:offset+limit].to_dict('records')
+    total = len(trademarks_table["df"])
+    trademarks = _records_window(trademarks_table, offset, limit)
     
-    return {"trademarks": trademarks, "total": total, "limit": limit, "offset": offset}
+    return stream_list_response("trademarks", trademarks, total=total, limit=limit, offset=offset)
 
 @app.get("/api/deadlines")
 async def api_get_deadlines(limit: int = 100, offset: int = 0, urgency: Optional[str] = None):
     """Get deadlines data"""
-    deadlines_data = await load_csv_data("deadlines.csv")
-    if deadlines_data is None:
+    deadlines_table = await load_table("deadlines.csv")
+    if deadlines_table is None:
         return {"deadlines": [], "total": 0}
     
     # Filter by urgency if specified
     if urgency:
-        # This would require processing urgency in real-time
-        pass
+        if urgency not in URGENCY_LEVELS:
+            raise HTTPException(status_code=400, detail=f"Unknown urgency: {urgency}")
+        _, _, buckets = _deadline_urgency_index(deadlines_table)
+        rows = buckets[urgency]
+        total = len(rows)
+        deadlines = iter_records(deadlines_table["cols"], rows[offset:offset+limit])
+    else:
+        total = len(deadlines_table["df"])
+        deadlines = _records_window(deadlines_table, offset, limit)
+    
+    return stream_list_response("deadlines", deadlines, total=total, limit=limit, offset=offset)
+
+# Number of recent validation reports shown on the validation page
+MAX_LISTED_REPORTS = 10
+
+# Parsed validation reports keyed by path, tagged with the file's st_mtime_ns.
+# Shared between requests; callers copy before adding fields.
+_REPORT_CACHE: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+
+# Pages up to this many rows are cached as records (see _records_page);
+# larger windows are streamed in batches of STREAM_BATCH_ROWS uncached
+PAGE_CACHE_MAX_ROWS = 1000
+STREAM_BATCH_ROWS = 1000
+# Record pages kept per cached table
+MAX_CACHED_PAGES = 256
+
+def _json_safe(obj: Any) -> Any:
+    """Replace NaN/Infinity with None and numpy values with Python ones, as orjson does"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _json_safe(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_json_safe(value) for value in obj]
+    if isinstance(obj, np.ndarray):
+        return _json_safe(obj.tolist())
+    if isinstance(obj, np.generic):
+        return _json_safe(obj.item())
+    return obj
+
+def _dumps(obj: Any) -> bytes:
+    """Encode a value as JSON bytes, writing NaN as null"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(_json_safe(obj), default=str, allow_nan=False).encode()
+
+def iter_records(cols: Dict[str, np.ndarray], rows: np.ndarray, batch_size: int = STREAM_BATCH_ROWS) -> Iterator[Dict[str, Any]]:
+    """Yield row dicts for the given row positions, one batch at a time"""
+    for start in range(0, len(rows), batch_size):
+        yield from table_records(cols, rows[start:start+batch_size])
+
+def _records_window(table: Dict[str, Any], offset: int, limit: int) -> Iterable[Dict[str, Any]]:
+    """Records for an API page, cached when small and streamed when large"""
+    if limit <= PAGE_CACHE_MAX_ROWS:
+        return _records_page(table, offset, limit)
+    rows = np.arange(len(table["df"]))[offset:offset+limit]
+    return iter_records(table["cols"], rows)
+
+def stream_list_response(key: str, records: Iterable[Dict[str, Any]], **fields: Any) -> StreamingResponse:
+    """Stream {key: [records...], **fields} as a JSON object
+
+    Records are encoded and sent in batches, so the full JSON body is never
+    held in memory at once.
+    """
+    def generate() -> Iterator[bytes]:
+        yield b"{" + _dumps(key) + b":["
+        rows = iter(records)
+        separator = b""
+        while batch := list(islice(rows, STREAM_BATCH_ROWS)):
+            yield separator + b",".join(_dumps(record) for record in batch)
+            separator = b","
+        yield b"]"
+        for name, value in fields.items():
+            yield b"," + _dumps(name) + b":" + _dumps(value)
+        yield b"}"
+    
+    return StreamingResponse(generate(), media_type="application/json")
+
+# Directory listings are reused for this many seconds between requests
+DIRECTORY_SCAN_TTL = 5.0
+
+def ttl_cache(seconds: float):
+    """Cache the result of a no-argument function for a number of seconds"""
+    def decorator(func):
+        state = {"expires": 0.0, "value": None}
+        
+        @wraps(func)
+        def wrapper():
+            now = time.monotonic()
+            if now >= state["expires"]:
+                state["value"] = func()
+                state["expires"] = now + seconds
+            return state["value"]
+        
+        wrapper.cache_clear = lambda: state.update(expires=0.0)
+        return wrapper
+    return decorator
+
+# Parsed tables keyed by (filename, columns), tagged with the (path,
+# st_mtime_ns, st_size) of the file they were read from, since a name can
+# resolve to its CSV or its Parquet sibling. Each table holds the frame
+# ("df"), its columns as numpy arrays ("cols") and per-column value counts
+# ("counts"), plus record pages ("pages") and the deadline urgency index
+# ("urgency") filled in on first use. Cached tables are shared between
+# requests; only those lazily filled entries are ever added to.
+_TABLE_CACHE: Dict[Tuple[str, Optional[Tuple[str, ...]]], Tuple[Path, int, int, Dict[str, Any]]] = {}
+
+# Low-cardinality text columns are loaded as categoricals, which shrinks the
+# cached frames and makes value_counts/filters work on integer codes
+_CSV_DTYPES: Dict[str, Dict[str, str]] = {
+    "clients.csv": {
+        "client_type": "category", "state_province": "category", "country": "category",
+        "status": "category", "payment_terms": "category"
+    },
+    "patents.csv": {
+        "jurisdiction": "category", "patent_office": "category", "status": "category",
+        "patent_type": "category", "technology_field": "category", "examination_status": "category"
+    },
+    "trademarks.csv": {
+        "mark_type": "category", "goods_services": "category", "jurisdiction": "category",
+        "trademark_office": "category", "status": "category", "use_basis": "category"
+    },
+    "deadlines.csv": {
+        "related_type": "category", "deadline_type": "category", "priority": "category",
+        "status": "category", "reminder_sent": "category"
+    }
+}
+
+# Per-column value counts read without loading the whole table, keyed by
+# (filename, column) and tagged like _TABLE_CACHE
+_COUNTS_CACHE: Dict[Tuple[str, str], Tuple[Path, int, int, Dict[Any, int]]] = {}
+
+# Helper functions
+def fast_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convert a DataFrame to row dicts, like df.to_dict('records')
+
+    Each column is converted to Python objects with a single tolist() call
+    and rows are zipped together, instead of boxing values cell by cell.
+    """
+    columns = df.columns.tolist()
+    values = [df.iloc[:, i].tolist() for i in range(len(columns))]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+def table_records(cols: Dict[str, np.ndarray], rows: Union[slice, np.ndarray] = slice(None)) -> List[Dict[str, Any]]:
+    """Row dicts for a slice or positions of a table's column arrays"""
+    names = list(cols)
+    values = [cols[name][rows].tolist() for name in names]
+    return [dict(zip(names, row)) for row in zip(*values)]
+
+def _value_counts(values: pd.Series) -> Dict[Any, int]:
+    """Counts of the non-null values, most frequent first
+
+    Ties keep the order of first appearance, matching _column_value_counts.
+    """
+    codes, uniques = pd.factorize(values)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    order = np.argsort(-counts, kind="stable")
+    return dict(zip(np.asarray(uniques)[order].tolist(), counts[order].tolist()))
+
+def _build_table(filename: str, data: pd.DataFrame) -> Dict[str, Any]:
+    """Column arrays and categorical value counts for a loaded frame"""
+    return {
+        "df": data,
+        "cols": {name: data[name].to_numpy() for name in data.columns},
+        "counts": {
+            name: _value_counts(data[name])
+            for name in _CSV_DTYPES.get(filename, {}) if name in data.columns
+        },
+        "pages": {},
+        "urgency": {}
+    }
+
+def _load_table(filename: str, file_path: Path, columns: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Read a data file and build its cached table"""
+    return _build_table(filename, _read_data_file(file_path, columns))
+
+def _table_counts(table: Dict[str, Any], column: str) -> Dict[Any, int]:
+    """Value counts for a column of a cached table, computed once"""
+    counts = table["counts"]
+    if column not in counts:
+        counts[column] = _value_counts(table["df"][column])
+    return counts[column]
+
+def _records_page(table: Dict[str, Any], offset: int, limit: int) -> List[Dict[str, Any]]:
+    """Records for one page of a cached table
+
+    Pages live on the table, so they go away with it when the file changes.
+    """
+    pages = table["pages"]
+    key = (offset, limit)
+    if key not in pages:
+        if len(pages) >= MAX_CACHED_PAGES:
+            pages.pop(next(iter(pages)))  # oldest first
+        pages[key] = table_records(table["cols"], slice(offset, offset+limit))
+    return pages[key]
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Stat a path, None if it does not exist"""
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        return None
+
+def _resolve_data_file(filename: str) -> Optional[Tuple[Path, os.stat_result]]:
+    """Return the file to read for a CSV name and its stat, preferring a fresh Parquet sibling"""
+    csv_path = DATA_DIR / filename
+    csv_stat = _stat_or_none(csv_path)
+    if pyarrow is not None:
+        parquet_path = csv_path.with_suffix(".parquet")
+        parquet_stat = _stat_or_none(parquet_path)
+        if parquet_stat is not None and (csv_stat is None or parquet_stat.st_mtime >= csv_stat.st_mtime):
+            return parquet_path, parquet_stat
+    return (csv_path, csv_stat) if csv_stat is not None else None
+
+def _read_data_file(file_path: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Read a Parquet or CSV data file, optionally restricted to some columns"""
+    dtypes = _CSV_DTYPES.get(file_path.with_suffix(".csv").name, {})
+    if file_path.suffix == ".parquet":
+        data = pd.read_parquet(file_path, engine="pyarrow", columns=columns)
+    elif pyarrow is not None:
+        # Arrow parses the memory-mapped file with its multithreaded reader.
+        # dtypes are applied afterwards: passing dtype= to the pyarrow engine
+        # changes how it converts other nullable integer columns.
+        with pyarrow.memory_map(str(file_path), "r") as source:
+            data = pd.read_csv(source, engine="pyarrow", usecols=columns)
+    else:
+        return pd.read_csv(file_path, usecols=columns, dtype=dtypes or None)
+    return data.astype({c: t for c, t in dtypes.items() if c in data.columns})
+
+def _fast_row_count(file_path: Path) -> int:
+    """Count data rows without parsing any values
+
+    Parquet files report the count from their footer metadata; CSVs are
+    scanned for newlines in binary chunks. Quoted fields containing line
+    breaks are not accounted for, which the legacy exports never produce.
+    """
+    if file_path.suffix == ".parquet":
+        return pyarrow.parquet.ParquetFile(file_path).metadata.num_rows
+    
+    lines = 0
+    last = b"\n"
+    with open(file_path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+    if last != b"\n":
+        lines += 1  # final line without a trailing newline
+    return max(lines - 1, 0)  # minus the header row
+
+def _column_value_counts(file_path: Path, column: str) -> Dict[Any, int]:
+    """Count the values of a single column with Arrow, most frequent first"""
+    if file_path.suffix == ".parquet":
+        table = pyarrow.parquet.read_table(file_path, columns=[column])
+    else:
+        convert_options = pyarrow.csv.ConvertOptions(
+            include_columns=[column], strings_can_be_null=True
+        )
+        with pyarrow.memory_map(str(file_path), "r") as source:
+            table = pyarrow.csv.read_csv(source, convert_options=convert_options)
+    
+    # Nulls are dropped to match pandas value_counts()
+    pairs = [
+        (item["values"], item["counts"])
+        for item in pyarrow.compute.value_counts(table.column(column)).to_pylist()
+        if item["values"] is not None
+    ]
+    pairs.sort(key=lambda pair: pair[1], reverse=True)
+    return dict(pairs)
+
+async def count_rows(filename: str) -> int:
+    """Count the data rows of a data file, 0 if it is missing or unreadable"""
+    resolved = _resolve_data_file(filename)
+    if resolved is None:
+        return 0
+    
+    file_path = resolved[0]
+    try:
+        return await asyncio.to_thread(_fast_row_count, file_path)
+    except Exception as e:
+        logger.error(f"Error counting rows in {file_path.name}: {e}")
+        return 0
+
+async def get_value_counts(filename: str, column: str) -> Dict[Any, int]:
+    """Get value counts for one column of a data file"""
+    if pyarrow is None:
+        table = await load_table(filename, columns=[column])
+        return _table_counts(table, column) if table is not None else {}
+    
+    resolved = _resolve_data_file(filename)
+    if resolved is None:
+        return {}
+    
+    # Reuse the full table when an endpoint has already loaded it
+    file_path, stat = resolved
+    tag = (file_path, stat.st_mtime_ns, stat.st_size)
+    cached = _TABLE_CACHE.get((filename, None))
+    if cached is not None and cached[:3] == tag:
+        return _table_counts(cached[3], column)
+    
+    key = (filename, column)
+    cached = _COUNTS_CACHE.get(key)
+    if cached is not None and cached[:3] == tag:
+        return cached[3]
     
-    total = len(deadlines_data)
-    deadlines = deadlines_data.iloc[offset:offset+limit].to_dict('records')
+    try:
+        counts = await asyncio.to_thread(_column_value_counts, file_path, column)
+    except Exception as e:
+        logger.error(f"Error counting {column} in {filename}: {e}")
+        return {}
     
-    return {"deadlines": deadlines, "total": total, "limit": limit, "offset": offset}
+    _COUNTS_CACHE[key] = (*tag, counts)
+    return counts
 
-# Helper functions
-async def load_csv_data(filename: str) -> Optional[pd.DataFrame]:
-    """Load CSV data"""
-    file_path = DATA_DIR / filename
-    if not file_path.exists():
+async def load_table(filename: str, columns: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+    """Load a data file as a cached table, reused while the file is unchanged"""
+    resolved = _resolve_data_file(filename)
+    if resolved is None:
         return None
     
+    file_path, stat = resolved
+    key = (filename, tuple(columns) if columns else None)
+    tag = (file_path, stat.st_mtime_ns, stat.st_size)
+    cached = _TABLE_CACHE.get(key)
+    if cached is not None and cached[:3] == tag:
+        return cached[3]
+    
     try:
-        return pd.read_csv(file_path)
+        table = await asyncio.to_thread(_load_table, filename, file_path, columns)
+    except FileNotFoundError:
+        return None
     except Exception as e:
         logger.error(f"Error loading {filename}: {e}")
         return None
+    
+    _TABLE_CACHE[key] = (*tag, table)
+    return table
+
+async def load_csv_data(filename: str, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+    """Load CSV data, reusing the parsed frame while the file is unchanged"""
+    table = await load_table(filename, columns)
+    return table["df"] if table is not None else None
 
 async def get_data_statistics() -> Dict[str, Any]:
     """Get data statistics"""
@@ -293,56 +672,98 @@ async def get_data_statistics() -> Dict[str, Any]:
         "last_updated": None
     }
     
-    for entity in ["clients", "patents", "trademarks", "deadlines"]:
-        data = await load_csv_data(f"{entity}.csv")
-        if data is not None:
-            stats[entity] = len(data)
+    entities = ["clients", "patents", "trademarks", "deadlines"]
+    counts, latest_mtime = await asyncio.gather(
+        asyncio.gather(*[count_rows(f"{entity}.csv") for entity in entities]),
+        asyncio.to_thread(_latest_csv_mtime)
+    )
+    stats.update(zip(entities, counts))
     
     # Get last modification time
-    files = list(DATA_DIR.glob("*.csv"))
-    if files:
-        latest_file = max(files, key=lambda f: f.stat().st_mtime)
-        stats["last_updated"] = datetime.fromtimestamp(latest_file.stat().st_mtime).isoformat()
+    if latest_mtime is not None:
+        stats["last_updated"] = datetime.fromtimestamp(latest_mtime).isoformat()
     
     return stats
 
+@ttl_cache(DIRECTORY_SCAN_TTL)
+def _latest_csv_mtime() -> Optional[float]:
+    """Most recent modification time across the legacy CSV files"""
+    with os.scandir(DATA_DIR) as entries:
+        mtimes = [entry.stat().st_mtime for entry in entries if entry.name.endswith(".csv")]
+    return max(mtimes) if mtimes else None
+
+@ttl_cache(DIRECTORY_SCAN_TTL)
+def _validation_report_files() -> List[Tuple[int, Path]]:
+    """(st_mtime_ns, path) of the newest validation reports, most recent first
+
+    Parsed reports that are no longer listed are dropped from _REPORT_CACHE.
+    """
+    try:
+        with os.scandir(VALIDATION_REPORTS_DIR) as entries:
+            reports = [
+                (entry.stat().st_mtime_ns, Path(entry.path))
+                for entry in entries
+                if entry.name.startswith("validation_report_") and entry.name.endswith(".json")
+            ]
+    except FileNotFoundError:
+        reports = []
+    
+    newest = heapq.nlargest(MAX_LISTED_REPORTS, reports)
+    listed = {report_file for _, report_file in newest}
+    for report_file in _REPORT_CACHE.keys() - listed:
+        _REPORT_CACHE.pop(report_file, None)
+    return newest
+
+def _read_json(file_path: Path) -> Any:
+    """Parse a JSON file, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(file_path.read_bytes())
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
+def _read_validation_report(report_file: Path, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a validation report, reusing the cached copy while unchanged"""
+    cached = _REPORT_CACHE.get(report_file)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    
+    report = _read_json(report_file)
+    _REPORT_CACHE[report_file] = (mtime_ns, report)
+    return report
+
 async def get_latest_validation_report() -> Optional[Dict[str, Any]]:
     """Get the latest validation report"""
-    if not VALIDATION_REPORTS_DIR.exists():
-        return None
-    
-    report_files = list(VALIDATION_REPORTS_DIR.glob("validation_report_*.json"))
+    return await asyncio.to_thread(_load_latest_validation_report)
+
+def _load_latest_validation_report() -> Optional[Dict[str, Any]]:
+    """Read the most recent validation report from disk"""
+    report_files = _validation_report_files()
     if not report_files:
         return None
     
     # Get the most recent report
-    latest_file = max(report_files, key=lambda f: f.stat().st_mtime)
+    mtime_ns, latest_file = report_files[0]
     
     try:
-        with open(latest_file, 'r') as f:
-            return json.load(f)
+        return _read_validation_report(latest_file, mtime_ns)
     except Exception as e:
         logger.error(f"Error loading validation report: {e}")
         return None
 
 async def get_validation_reports() -> List[Dict[str, Any]]:
     """Get all validation reports"""
-    if not VALIDATION_REPORTS_DIR.exists():
-        return []
-    
+    return await asyncio.to_thread(_load_validation_reports)
+
+def _load_validation_reports() -> List[Dict[str, Any]]:
+    """Read the most recent validation reports from disk"""
     reports = []
-    report_files = sorted(
-        VALIDATION_REPORTS_DIR.glob("validation_report_*.json"),
-        key=lambda f: f.stat().st_mtime,
-        reverse=True
-    )
+    report_files = _validation_report_files()
     
-    for report_file in report_files[:10]:  # Get last 10 reports
+    for mtime_ns, report_file in report_files:
         try:
-            with open(report_file, 'r') as f:
-                report = json.load(f)
-                report['filename'] = report_file.name
-                reports.append(report)
+            report = dict(_read_validation_report(report_file, mtime_ns))
+            report['filename'] = report_file.name
+            reports.append(report)
         except Exception as e:
             logger.error(f"Error loading report {report_file}: {e}")
     
@@ -358,54 +779,55 @@ async def get_analytics_data() -> Dict[str, Any]:
         "filing_trends": {}
     }
     
-    # Patent status distribution
-    patents_data = await load_csv_data("patents.csv")
-    if patents_data is not None:
-        status_counts = patents_data['status'].value_counts().to_dict()
-        analytics["patent_status_distribution"] = status_counts
-    
-    # Trademark status distribution
-    trademarks_data = await load_csv_data("trademarks.csv")
-    if trademarks_data is not None:
-        status_counts = trademarks_data['status'].value_counts().to_dict()
-        analytics["trademark_status_distribution"] = status_counts
-    
-    # Deadlines by priority
-    deadlines_data = await load_csv_data("deadlines.csv")
-    if deadlines_data is not None:
-        priority_counts = deadlines_data['priority'].value_counts().to_dict()
-        analytics["deadlines_by_priority"] = priority_counts
-    
-    # Clients by type
-    clients_data = await load_csv_data("clients.csv")
-    if clients_data is not None:
-        type_counts = clients_data['client_type'].value_counts().to_dict()
-        analytics["clients_by_type"] = type_counts
+    # Status, priority and type distributions, read concurrently
+    (
+        analytics["patent_status_distribution"],
+        analytics["trademark_status_distribution"],
+        analytics["deadlines_by_priority"],
+        analytics["clients_by_type"]
+    ) = await asyncio.gather(
+        get_value_counts("patents.csv", "status"),
+        get_value_counts("trademarks.csv", "status"),
+        get_value_counts("deadlines.csv", "priority"),
+        get_value_counts("clients.csv", "client_type")
+    )
     
     return analytics
 
 async def run_validation_background():
     """Run validation in background"""
     try:
+        # Sequential and off the event loop; validate_all only forks workers from the CLI
         validator = IPMSDataValidator()
-        validator.validate_all()
+        await asyncio.to_thread(validator.validate_all)
         logger.info("Background validation completed")
     except Exception as e:
         logger.error(f"Background validation failed: {e}")
+    finally:
+        _validation_report_files.cache_clear()
 
 async def run_data_generation_background():
     """Run data generation in background"""
     try:
-        generate_data()
+        # In-process and sequential; only the generator's CLI forks worker processes
+        await asyncio.to_thread(generate_data)
         logger.info("Background data generation completed")
     except Exception as e:
         logger.error(f"Background data generation failed: {e}")
+    finally:
+        _TABLE_CACHE.clear()
+        _COUNTS_CACHE.clear()
+        _latest_csv_mtime.cache_clear()
 
 if __name__ == "__main__":
+    # WEB_CONCURRENCY > 1 runs several worker processes; auto-reload only
+    # works with a single process, so it is kept for the default dev setup
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=workers == 1,
+        workers=workers,
         log_level="info"
     )
@@ -5,12 +5,21 @@ Generates realistic data with intentional quality issues typical of legacy syste
 """
 
 import csv
-import random
+import os
+import re
 import json
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any
 import uuid
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (engine for DataFrame.to_parquet)
+except ImportError:
+    pyarrow = None
 
 # Configuration
 NUM_CLIENTS = 500
@@ -22,10 +31,41 @@ NUM_INVOICES = 400
 NUM_ASSIGNMENTS = 600
 NUM_DOCUMENTS = 2000
 
+# Seed for the random generator; the same seed reproduces the same data
+SEED = int(os.getenv("MOCK_SEED", "42"))
+rng = np.random.default_rng(SEED)
+
+# Each table draws from its own stream derived from SEED, so the output does
+# not depend on which process generates a table or in what order
+TABLES = ("clients", "patents", "trademarks", "deadlines")
+
 ROOT = Path(__file__).resolve().parents[1]
 OUTPUT_DIR = ROOT / "data" / "legacy_csv"
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Generated CSVs are written through a 1 MiB buffer, so each file costs a few
+# write() calls instead of one per 8 KiB default buffer
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Columns the web app loads as pandas categoricals (app/main.py _CSV_DTYPES);
+# the Parquet copies store them the same way
+CATEGORY_COLUMNS = {
+    "clients.csv": ("client_type", "state_province", "country", "status", "payment_terms"),
+    "patents.csv": ("jurisdiction", "patent_office", "status", "patent_type", "technology_field",
+                    "examination_status"),
+    "trademarks.csv": ("mark_type", "goods_services", "jurisdiction", "trademark_office", "status",
+                       "use_basis"),
+    "deadlines.csv": ("related_type", "deadline_type", "priority", "status", "reminder_sent")
+}
+
+# CSV text the app's reader parses as missing (pandas' default na_values)
+# or as a number
+MISSING_TEXT = (
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null"
+)
+NUMERIC_TEXT = r"-?\d+(\.\d+)?"
+
 # Sample data for realistic generation
 FIRST_NAMES = [
     "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
@@ -146,295 +186,384 @@ TECHNOLOGY_FIELDS = [
 
 NICE_CLASSES = [1, 3, 5, 9, 10, 11, 12, 16, 17, 18, 19, 20, 21, 25, 28, 29, 30, 32, 35, 36, 38, 41, 42, 44, 45]
 
-def random_date(start_year=2018, end_year=2024, format_variation=True):
-    """Generate random date with format variations typical of legacy systems"""
-    start_date = datetime(start_year, 1, 1)
-    end_date = datetime(end_year, 12, 31)
-    
-    time_between = end_date - start_date
-    days_between = time_between.days
-    random_days = random.randrange(days_between)
-    random_date = start_date + timedelta(days=random_days)
+# Filing jurisdictions (in their inconsistent legacy spellings) and the office
+# handling each one
+PATENT_OFFICE_BY_JURISDICTION = {
+    "US": "USPTO", "USA": "USPTO", "United States": "USPTO",
+    "EP": "EPO", "Europe": "EPO",
+    "GB": "UKIPO", "DE": "DPMA", "JP": "JPO", "CN": "CNIPA"
+}
+
+TM_OFFICE_BY_JURISDICTION = {
+    "US": "USPTO", "USA": "USPTO", "United States": "USPTO",
+    "EU": "EUIPO", "Europe": "EUIPO",
+    "GB": "UKIPO", "DE": "DPMA", "JP": "JPO", "CN": "CNIPA"
+}
+
+def seed_table(table):
+    """Switch the module generator to the random stream reserved for a table"""
+    global rng
+    rng = np.random.default_rng(np.random.SeedSequence(SEED, spawn_key=(TABLES.index(table),)))
+
+# Bulk sampling helpers: each draws a whole column in one call
+def choose(options, n):
+    """Pick n values from options, uniformly with replacement"""
+    return np.asarray(options, dtype=object)[rng.integers(0, len(options), n)]
+
+def chance(probability, n):
+    """Boolean mask that is True for each of n rows with the given probability"""
+    return rng.random(n) < probability
+
+def sometimes(values, probability):
+    """Keep each value with the given probability, blank it otherwise"""
+    values = np.asarray(values, dtype=object)
+    return np.where(chance(probability, len(values)), values, "")
+
+def choose_jurisdictions(office_by_jurisdiction, n):
+    """Pick n jurisdictions uniformly, returning them with their offices"""
+    index = rng.integers(0, len(office_by_jurisdiction), n)
+    jurisdictions = np.array(list(office_by_jurisdiction), dtype=object)
+    offices = np.array(list(office_by_jurisdiction.values()), dtype=object)
+    return jurisdictions.take(index), offices.take(index)
+
+def prefixed_ids(prefix, numbers, width=0):
+    """Format an integer array as prefix + number, zero-padded to width"""
+    return np.char.add(prefix, np.char.zfill(numbers.astype(str), width)).astype(object)
+
+def sequential_ids(prefix, n):
+    """Record ids prefix-0001 .. prefix-n"""
+    return prefixed_ids(prefix, np.arange(1, n + 1), 4)
+
+def costs(low, high, n, probability):
+    """n dollar amounts between low and high with 2 decimals, present with the given probability (NaN otherwise)"""
+    amounts = rng.uniform(low, high, n).round(2)
+    return np.where(chance(probability, n), amounts, np.nan)
+
+# Date formats seen in the legacy system, and the junk values it holds
+# instead of dates for about 5% of records
+DATE_FORMATS = (
+    '%Y-%m-%d',
+    '%m/%d/%Y',
+    '%d/%m/%Y',
+    '%Y/%m/%d',
+    '%m-%d-%Y',
+    '%d-%m-%Y',
+    '%B %d, %Y',
+    '%d %B %Y',
+    '%m/%d/%y',
+    '%d/%m/%y'
+)
+BAD_DATES = ('', 'N/A', 'TBD', 'Unknown', '00/00/0000', '1900-01-01')
+
+MONTH_NAMES = np.array([
+    "January", "February", "March", "April", "May", "June", "July",
+    "August", "September", "October", "November", "December"
+], dtype=object)
+TWO_DIGITS = np.array([f"{i:02d}" for i in range(100)], dtype=object)
+
+def format_dates(dates, fmt):
+    """strftime for an array of datetime64[D] values, limited to %Y %y %m %d %B"""
+    months = dates.astype('datetime64[M]').astype(np.int64)
+    years = dates.astype('datetime64[Y]').astype(np.int64) + 1970
+    fields = {
+        'Y': years.astype(str).astype(object),
+        'y': TWO_DIGITS[years % 100],
+        'm': TWO_DIGITS[months % 12 + 1],
+        'd': TWO_DIGITS[(dates - dates.astype('datetime64[M]')).astype(np.int64) + 1],
+        'B': MONTH_NAMES[months % 12]
+    }
+    # re.split with a group alternates literal text and directive letters
+    result = np.full(len(dates), "", dtype=object)
+    for i, piece in enumerate(re.split(r'%(\w)', fmt)):
+        result = result + (fields[piece] if i % 2 else piece)
+    return result
+
+def random_dates(n, start_year=2018, end_year=2024, format_variation=True):
+    """Generate n random dates with format variations typical of legacy systems"""
+    days_between = (datetime(end_year, 12, 31) - datetime(start_year, 1, 1)).days
+    dates = np.datetime64(f'{start_year}-01-01') + rng.integers(0, days_between, n).astype('timedelta64[D]')
     
     if not format_variation:
-        return random_date.strftime('%Y-%m-%d')
+        return np.datetime_as_string(dates, unit='D').astype(object)
     
     # Introduce format variations typical of legacy systems
-    formats = [
-        '%Y-%m-%d',
-        '%m/%d/%Y', 
-        '%d/%m/%Y',
-        '%Y/%m/%d',
-        '%m-%d-%Y',
-        '%d-%m-%Y',
-        '%B %d, %Y',
-        '%d %B %Y',
-        '%m/%d/%y',
-        '%d/%m/%y'
-    ]
+    format_index = rng.integers(0, len(DATE_FORMATS), n)
+    result = np.empty(n, dtype=object)
+    for i, fmt in enumerate(DATE_FORMATS):
+        rows = format_index == i
+        result[rows] = format_dates(dates[rows], fmt)
     
     # Sometimes return empty or malformed dates
-    if random.random() < 0.05:  # 5% chance of bad data
-        bad_dates = ['', 'N/A', 'TBD', 'Unknown', '00/00/0000', '1900-01-01']
-        return random.choice(bad_dates)
-    
-    return random_date.strftime(random.choice(formats))
-
-def random_phone():
-    """Generate phone number with format variations"""
-    formats = [
-        '+1-{}-{}-{}',
-        '({}) {}-{}',
-        '{}.{}.{}',
-        '{}-{}-{}',
-        '1-{}-{}-{}',
-        '+1 {} {} {}',
-        '{} {} {}'
-    ]
-    
-    area = random.randint(200, 999)
-    exchange = random.randint(200, 999)
-    number = random.randint(1000, 9999)
-    
-    if random.random() < 0.03:  # 3% chance of bad data
-        return random.choice(['', 'N/A', 'Unknown', '000-000-0000'])
+    return np.where(chance(0.05, n), choose(BAD_DATES, n), result)  # 5% chance of bad data
+
+# Phone number layouts (area, exchange, number) and the junk values held
+# instead of a number for about 3% of records
+PHONE_FORMATS = (
+    '+1-{}-{}-{}',
+    '({}) {}-{}',
+    '{}.{}.{}',
+    '{}-{}-{}',
+    '1-{}-{}-{}',
+    '+1 {} {} {}',
+    '{} {} {}'
+)
+BAD_PHONES = ('', 'N/A', 'Unknown', '000-000-0000')
+
+def random_phones(n):
+    """Generate n phone numbers with format variations"""
+    phones = np.array([
+        PHONE_FORMATS[f].format(area, exchange, number)
+        for f, area, exchange, number in zip(
+            rng.integers(0, len(PHONE_FORMATS), n),
+            rng.integers(200, 1000, n),
+            rng.integers(200, 1000, n),
+            rng.integers(1000, 10000, n)
+        )
+    ], dtype=object)
     
-    format_str = random.choice(formats)
-    return format_str.format(area, exchange, number)
+    return np.where(chance(0.03, n), choose(BAD_PHONES, n), phones)  # 3% chance of bad data
+
+def csv_values(values):
+    """Column values as written to CSV: float columns become text, NaN a blank cell"""
+    if isinstance(values, np.ndarray) and values.dtype.kind == 'f':
+        return np.where(np.isnan(values), "", values.astype(str))
+    return values
+
+def write_csv(columns, filename):
+    """Write generated columns to OUTPUT_DIR as CSV, one tuple per row"""
+    with open(OUTPUT_DIR / filename, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(columns.keys())
+        writer.writerows(zip(*map(csv_values, columns.values())))
 
 def generate_clients():
     """Generate client data with quality issues"""
     print("Generating clients...")
-    clients = []
-    
-    for i in range(NUM_CLIENTS):
-        client_id = f"CL-{str(i+1).zfill(4)}"
-        
-        # Randomly choose individual or company
-        is_company = random.random() < 0.3
-        
-        if is_company:
-            company_name = random.choice(COMPANY_NAMES)
-            if random.random() < 0.5:
-                company_name += " " + random.choice(["Inc", "Corp", "LLC", "Ltd"])
-            
-            client_name = company_name
-            first_name = ""
-            last_name = ""
-            client_type = random.choice(["company", "corporation", ""])  # Sometimes empty
-        else:
-            first_name = random.choice(FIRST_NAMES)
-            last_name = random.choice(LAST_NAMES)
-            
-            # Legacy format: "Last, First" (sometimes inconsistent)
-            if random.random() < 0.8:
-                client_name = f"{last_name}, {first_name}"
-            else:
-                client_name = f"{first_name} {last_name}"
-            
-            company_name = ""
-            client_type = random.choice(["individual", "person", ""])
-        
-        # Contact info with quality issues
-        email = ""
-        if random.random() < 0.85:  # 15% missing emails
-            if is_company:
-                email = f"legal@{company_name.lower().replace(' ', '').replace(',', '')}.com"
-            else:
-                email = f"{first_name.lower()}.{last_name.lower()}@example.com"
-            
-            # Introduce some email variations and errors
-            if random.random() < 0.05:
-                email = email.replace('@', '_at_')  # Malformed email
-        
-        phone = random_phone()
-        phone_mobile = random_phone() if random.random() < 0.6 else ""
-        
-        # Address with inconsistencies
-        city, state = random.choice(CITIES)
-        address_line1 = f"{random.randint(1, 9999)} {random.choice(['Main', 'Oak', 'First', 'Second', 'Park', 'Washington', 'Lincoln'])} {random.choice(['St', 'Ave', 'Dr', 'Blvd', 'Way'])}"
-        address_line2 = f"Suite {random.randint(100, 999)}" if random.random() < 0.3 else ""
-        
-        postal_code = str(random.randint(10000, 99999))
-        country = random.choice(COUNTRIES)
-        
-        # Sometimes duplicate billing address
-        billing_address = ""
-        if random.random() < 0.4:
-            billing_address = f"{address_line1}, {city}, {state} {postal_code}"
-        
-        status = random.choice(["active", "Active", "ACTIVE", "inactive", "suspended", ""])
-        
-        client = {
-            'client_id': client_id,
-            'client_name': client_name,
-            'first_name': first_name,
-            'last_name': last_name,
-            'company_name': company_name,
-            'client_type': client_type,
-            'email': email,
-            'email_secondary': "",
-            'phone': phone,
-            'phone_mobile': phone_mobile,
-            'fax': random_phone() if random.random() < 0.2 else "",
-            'address_line1': address_line1,
-            'address_line2': address_line2,
-            'city': city,
-            'state_province': state,
-            'postal_code': postal_code,
-            'country': country,
-            'billing_address': billing_address,
-            'created_on': random_date(2018, 2023),
-            'modified_on': random_date(2023, 2024) if random.random() < 0.6 else "",
-            'status': status,
-            'notes': "Legacy client record" if random.random() < 0.3 else "",
-            'credit_limit': round(random.uniform(1000, 50000), 2) if random.random() < 0.7 else "",
-            'payment_terms': random.choice(["30 days", "Net 30", "15 days", "COD", ""]) if random.random() < 0.8 else ""
-        }
-        
-        clients.append(client)
-    
-    # Write to CSV
-    with open(OUTPUT_DIR / "clients.csv", 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=clients[0].keys())
-        writer.writeheader()
-        writer.writerows(clients)
-    
-    print(f"Generated {len(clients)} clients")
-    return clients
+    seed_table("clients")
+    n = NUM_CLIENTS
+    
+    # Randomly choose individual or company
+    is_company = chance(0.3, n)
+    
+    company = choose(COMPANY_NAMES, n)
+    company = np.where(chance(0.5, n), company + " " + choose(["Inc", "Corp", "LLC", "Ltd"], n), company)
+    
+    first = choose(FIRST_NAMES, n)
+    last = choose(LAST_NAMES, n)
+    # Legacy format: "Last, First" (sometimes inconsistent)
+    person_name = np.where(chance(0.8, n), last + ", " + first, first + " " + last)
+    
+    client_type = np.where(
+        is_company,
+        choose(["company", "corporation", ""], n),  # Sometimes empty
+        choose(["individual", "person", ""], n)
+    )
+    
+    # Contact info with quality issues
+    email = np.array([
+        f"legal@{c.lower().replace(' ', '').replace(',', '')}.com" if is_co
+        else f"{f.lower()}.{l.lower()}@example.com"
+        for is_co, c, f, l in zip(is_company, company, first, last)
+    ], dtype=object)
+    # Introduce some email variations and errors
+    email = np.where(chance(0.05, n), [e.replace('@', '_at_') for e in email], email)  # Malformed email
+    email = sometimes(email, 0.85)  # 15% missing emails
+    
+    # Address with inconsistencies
+    city_index = rng.integers(0, len(CITIES), n)
+    city = np.array([c for c, _ in CITIES], dtype=object)[city_index]
+    state = np.array([s for _, s in CITIES], dtype=object)[city_index]
+    address_line1 = np.array([
+        f"{number} {street} {suffix}"
+        for number, street, suffix in zip(
+            rng.integers(1, 10000, n),
+            choose(['Main', 'Oak', 'First', 'Second', 'Park', 'Washington', 'Lincoln'], n),
+            choose(['St', 'Ave', 'Dr', 'Blvd', 'Way'], n)
+        )
+    ], dtype=object)
+    postal_code = rng.integers(10000, 100000, n).astype(str).astype(object)
+    
+    # Sometimes duplicate billing address
+    billing_address = sometimes([
+        f"{line1}, {c}, {st} {postal}"
+        for line1, c, st, postal in zip(address_line1, city, state, postal_code)
+    ], 0.4)
+    
+    columns = {
+        'client_id': sequential_ids("CL-", n),
+        'client_name': np.where(is_company, company, person_name),
+        'first_name': np.where(is_company, "", first),
+        'last_name': np.where(is_company, "", last),
+        'company_name': np.where(is_company, company, ""),
+        'client_type': client_type,
+        'email': email,
+        'email_secondary': np.full(n, "", dtype=object),
+        'phone': random_phones(n),
+        'phone_mobile': sometimes(random_phones(n), 0.6),
+        'fax': sometimes(random_phones(n), 0.2),
+        'address_line1': address_line1,
+        'address_line2': sometimes([f"Suite {s}" for s in rng.integers(100, 1000, n)], 0.3),
+        'city': city,
+        'state_province': state,
+        'postal_code': postal_code,
+        'country': choose(COUNTRIES, n),
+        'billing_address': billing_address,
+        'created_on': random_dates(n, 2018, 2023),
+        'modified_on': sometimes(random_dates(n, 2023, 2024), 0.6),
+        'status': choose(["active", "Active", "ACTIVE", "inactive", "suspended", ""], n),
+        'notes': sometimes(np.full(n, "Legacy client record", dtype=object), 0.3),
+        'credit_limit': costs(1000, 50000, n, 0.7),
+        'payment_terms': sometimes(choose(["30 days", "Net 30", "15 days", "COD", ""], n), 0.8)
+    }
+    print(f"Generated {n} clients")
+    return columns
 
 def generate_patents(clients):
     """Generate patent data with quality issues"""
     print("Generating patents...")
-    patents = []
-    
-    for i in range(NUM_PATENTS):
-        patent_id = f"PT-{str(i+1).zfill(4)}"
-        client = random.choice(clients)
-        
-        title = random.choice(PATENT_TITLES)
-        # Add some variation to titles
-        if random.random() < 0.3:
-            title += f" - {random.choice(['Improved', 'Advanced', 'Enhanced', 'Novel', 'Optimized'])}"
-        
-        abstract = f"This invention relates to {title.lower()}. The method involves innovative approaches to solving technical challenges in the field."
-        
-        # Inventors (comma-separated, sometimes messy)
-        num_inventors = random.randint(1, 4)
-        inventors = []
-        for _ in range(num_inventors):
-            inventor = f"{random.choice(LAST_NAMES)}, {random.choice(FIRST_NAMES)}"
-            inventors.append(inventor)
-        inventors_str = "; ".join(inventors) if random.random() < 0.6 else ", ".join(inventors)
-        
-        # Assignees
-        assignees = client['client_name'] if random.random() < 0.8 else ""
-        
+    seed_table("patents")
+    n = NUM_PATENTS
+    
+    client_index = rng.integers(0, len(clients['client_id']), n)
+    client_ids = clients['client_id'][client_index]
+    client_names = clients['client_name'][client_index]
+    
+    title = choose(PATENT_TITLES, n)
+    # Add some variation to titles
+    title = np.where(
+        chance(0.3, n),
+        title + " - " + choose(['Improved', 'Advanced', 'Enhanced', 'Novel', 'Optimized'], n),
+        title
+    )
+    abstract = [
+        f"This invention relates to {t.lower()}. The method involves innovative approaches to solving technical challenges in the field."
+        for t in title
+    ]
+    
+    # Inventors (comma-separated, sometimes messy)
+    num_inventors = rng.integers(1, 5, n)
+    inventor_last = choose(LAST_NAMES, (n, 4))
+    inventor_first = choose(FIRST_NAMES, (n, 4))
+    inventors = [
+        separator.join(f"{l}, {f}" for l, f in zip(lasts[:k], firsts[:k]))
+        for separator, k, lasts, firsts in zip(
+            np.where(chance(0.6, n), "; ", ", "), num_inventors, inventor_last, inventor_first
+        )
+    ]
+    
+    priority_date = sometimes(random_dates(n, 2018, 2022), 0.6)
+    
+    jurisdiction, patent_office = choose_jurisdictions(PATENT_OFFICE_BY_JURISDICTION, n)
+    
+    # IPC/CPC classes (sometimes messy format)
+    ipc_classes = np.array([
+        f"G06F {a}/{b}" for a, b in zip(rng.integers(1, 22, n), rng.integers(10, 100, n))
+    ], dtype=object)
+    ipc_classes = np.where(chance(0.5, n), ipc_classes + [
+        f"; H04L {a}/{b}" for a, b in zip(rng.integers(1, 30, n), rng.integers(10, 100, n))
+    ], ipc_classes)
+    
+    priority_claims = [
+        f'{{"country": "{j}", "number": "{number}", "date": "{p}"}}' if p else ""
+        for j, number, p in zip(jurisdiction, rng.integers(100000, 1000000, n), priority_date)
+    ]
+    
+    columns = {
+        'patent_id': sequential_ids("PT-", n),
+        'client_id': client_ids,
+        'title': title,
+        'abstract': abstract,
+        'inventors': inventors,
+        'assignees': sometimes(client_names, 0.8),
         # Application numbers with variations
-        app_number = f"{random.randint(10, 17)}/{random.randint(100000, 999999)}"
-        pub_number = f"US{random.randint(20180000000, 20240000000)}" if random.random() < 0.7 else ""
-        patent_number = f"US{random.randint(8000000, 12000000)}" if random.random() < 0.4 else ""
-        
-        filing_date = random_date(2018, 2023)
-        priority_date = random_date(2018, 2022) if random.random() < 0.6 else ""
-        pub_date = random_date(2019, 2024) if random.random() < 0.7 else ""
-        grant_date = random_date(2020, 2024) if random.random() < 0.4 else ""
-        expiry_date = random_date(2038, 2044) if random.random() < 0.5 else ""
-        
-        jurisdiction = random.choice(["US", "USA", "United States", "EP", "Europe", "GB", "DE", "JP", "CN"])
-        patent_office = {
-            "US": "USPTO", "USA": "USPTO", "United States": "USPTO",
-            "EP": "EPO", "Europe": "EPO",
-            "GB": "UKIPO", "DE": "DPMA", "JP": "JPO", "CN": "CNIPA"
-        }.get(jurisdiction, "USPTO")
-        
-        status = random.choice(["pending", "granted", "abandoned", "expired", "under examination", "issued"])
-        patent_type = random.choice(["utility", "design", "plant", "provisional"])
-        tech_field = random.choice(TECHNOLOGY_FIELDS)
-        
-        # IPC/CPC classes (sometimes messy format)
-        ipc_classes = f"G06F {random.randint(1, 21)}/{random.randint(10, 99)}"
-        if random.random() < 0.5:
-            ipc_classes += f"; H04L {random.randint(1, 29)}/{random.randint(10, 99)}"
-        
-        cpc_classes = f"G06F {random.randint(1, 21)}/{random.randint(1000, 9999)}"
-        
-        family_id = f"FAM-{random.randint(100000, 999999)}" if random.random() < 0.6 else ""
-        priority_claims = f'{{"country": "{jurisdiction}", "number": "{random.randint(100000, 999999)}", "date": "{priority_date}"}}' if priority_date else ""
-        
-        examination_status = random.choice(["", "First Action", "Final Rejection", "Allowance", "RCE Filed"])
-        annuity_date = random_date(2024, 2026) if random.random() < 0.3 else ""
-        
-        estimated_cost = round(random.uniform(5000, 50000), 2) if random.random() < 0.8 else ""
-        actual_cost = round(random.uniform(3000, 45000), 2) if random.random() < 0.6 else ""
-        
-        attorney_ref = f"ATT-{random.randint(1000, 9999)}" if random.random() < 0.7 else ""
-        internal_ref = f"INT-{random.randint(1000, 9999)}" if random.random() < 0.8 else ""
-        
-        patent = {
-            'patent_id': patent_id,
-            'client_id': client['client_id'],
-            'title': title,
-            'abstract': abstract,
-            'inventors': inventors_str,
-            'assignees': assignees,
-            'application_number': app_number,
-            'publication_number': pub_number,
-            'patent_number': patent_number,
-            'filing_date': filing_date,
-            'priority_date': priority_date,
-            'publication_date': pub_date,
-            'grant_date': grant_date,
-            'expiry_date': expiry_date,
-            'jurisdiction': jurisdiction,
-            'patent_office': patent_office,
-            'status': status,
-            'patent_type': patent_type,
-            'technology_field': tech_field,
-            'ipc_classes': ipc_classes,
-            'cpc_classes': cpc_classes,
-            'family_id': family_id,
-            'priority_claims': priority_claims,
-            'examination_status': examination_status,
-            'annuity_due_date': annuity_date,
-            'estimated_cost': estimated_cost,
-            'actual_cost': actual_cost,
-            'attorney_ref': attorney_ref,
-            'internal_ref': internal_ref,
-            'created_on': random_date(2018, 2023),
-            'modified_on': random_date(2023, 2024) if random.random() < 0.5 else "",
-            'notes': "Legacy patent record" if random.random() < 0.2 else ""
-        }
-        
-        patents.append(patent)
-    
-    # Write to CSV
-    with open(OUTPUT_DIR / "patents.csv", 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=patents[0].keys())
-        writer.writeheader()
-        writer.writerows(patents)
-    
-    print(f"Generated {len(patents)} patents")
-    return patents
+        'application_number': [
+            f"{a}/{b}" for a, b in zip(rng.integers(10, 18, n), rng.integers(100000, 1000000, n))
+        ],
+        'publication_number': sometimes(prefixed_ids("US", rng.integers(20180000000, 20240000001, n)), 0.7),
+        'patent_number': sometimes(prefixed_ids("US", rng.integers(8000000, 12000001, n)), 0.4),
+        'filing_date': random_dates(n, 2018, 2023),
+        'priority_date': priority_date,
+        'publication_date': sometimes(random_dates(n, 2019, 2024), 0.7),
+        'grant_date': sometimes(random_dates(n, 2020, 2024), 0.4),
+        'expiry_date': sometimes(random_dates(n, 2038, 2044), 0.5),
+        'jurisdiction': jurisdiction,
+        'patent_office': patent_office,
+        'status': choose(["pending", "granted", "abandoned", "expired", "under examination", "issued"], n),
+        'patent_type': choose(["utility", "design", "plant", "provisional"], n),
+        'technology_field': choose(TECHNOLOGY_FIELDS, n),
+        'ipc_classes': ipc_classes,
+        'cpc_classes': [
+            f"G06F {a}/{b}" for a, b in zip(rng.integers(1, 22, n), rng.integers(1000, 10000, n))
+        ],
+        'family_id': sometimes(prefixed_ids("FAM-", rng.integers(100000, 1000000, n)), 0.6),
+        'priority_claims': priority_claims,
+        'examination_status': choose(["", "First Action", "Final Rejection", "Allowance", "RCE Filed"], n),
+        'annuity_due_date': sometimes(random_dates(n, 2024, 2026), 0.3),
+        'estimated_cost': costs(5000, 50000, n, 0.8),
+        'actual_cost': costs(3000, 45000, n, 0.6),
+        'attorney_ref': sometimes(prefixed_ids("ATT-", rng.integers(1000, 10000, n)), 0.7),
+        'internal_ref': sometimes(prefixed_ids("INT-", rng.integers(1000, 10000, n)), 0.8),
+        'created_on': random_dates(n, 2018, 2023),
+        'modified_on': sometimes(random_dates(n, 2023, 2024), 0.5),
+        'notes': sometimes(np.full(n, "Legacy patent record", dtype=object), 0.2)
+    }
+    print(f"Generated {n} patents")
+    return columns
 
 def generate_trademarks(clients):
     """Generate trademark data with quality issues"""
     print("Generating trademarks...")
-    trademarks = []
-    
-    for i in range(NUM_TRADEMARKS):
-        tm_id = f"TM-{str(i+1).zfill(4)}"
-        client = random.choice(clients)
-        
-        mark_text = random.choice(TRADEMARK_MARKS)
-        if random.random() < 0.3:
-            mark_text += str(random.randint(1, 999))
-        
-        mark_type = random.choice(["word", "logo", "combined", "design", "composite", ""])
-        mark_description = f"Trademark for {mark_text}" if mark_type in ["logo", "combined", "design"] else ""
-        
+    seed_table("trademarks")
+    n = NUM_TRADEMARKS
+    
+    client_index = rng.integers(0, len(clients['client_id']), n)
+    client_ids = clients['client_id'][client_index]
+    
+    mark_text = choose(TRADEMARK_MARKS, n)
+    mark_text = np.where(chance(0.3, n), [f"{m}{x}" for m, x in zip(mark_text, rng.integers(1, 1000, n))], mark_text)
+    
+    mark_type = choose(["word", "logo", "combined", "design", "composite", ""], n)
+    is_figurative = np.isin(mark_type, ["logo", "combined", "design"])
+    
+    # Nice classes (comma-separated, sometimes messy): 1-3 distinct classes,
+    # taken from a random permutation of NICE_CLASSES per row
+    num_classes = rng.integers(1, 4, n)
+    class_order = np.argsort(rng.random((n, len(NICE_CLASSES))), axis=1)[:, :3]
+    nice_classes = [
+        separator.join(str(c) for c in classes[:k])
+        for separator, k, classes in zip(
+            np.where(chance(0.3, n), ", ", ","),  # Add spaces sometimes
+            num_classes, np.asarray(NICE_CLASSES)[class_order]
+        )
+    ]
+    
+    registration_date = sometimes(random_dates(n, 2020, 2024), 0.4)
+    is_registered = registration_date != ""
+    
+    jurisdiction, tm_office = choose_jurisdictions(TM_OFFICE_BY_JURISDICTION, n)
+    
+    status = choose(["pending", "registered", "opposed", "cancelled", "abandoned", "expired", "published"], n)
+    
+    use_basis = np.where(
+        np.isin(jurisdiction, ["US", "USA", "United States"]),
+        choose(["1(a)", "1(b)", "intent-to-use", "use-in-commerce", ""], n),
+        ""
+    )
+    first_use = np.where(
+        np.isin(use_basis, ["1(a)", "use-in-commerce"]) & chance(0.6, n),
+        random_dates(n, 2015, 2022),
+        ""
+    )
+    first_commerce = np.where((first_use != "") & chance(0.8, n), random_dates(n, 2016, 2023), "")
+    
+    columns = {
+        'tm_id': sequential_ids("TM-", n),
+        'client_id': client_ids,
+        'mark_text': mark_text,
+        'mark_type': mark_type,
+        'mark_description': np.where(is_figurative, [f"Trademark for {m}" for m in mark_text], ""),
         # Goods and services
-        goods_services = random.choice([
+        'goods_services': choose([
             "Computer software and hardware",
             "Pharmaceutical preparations",
             "Clothing and apparel",
@@ -445,205 +574,195 @@ def generate_trademarks(clients):
             "Medical devices",
             "Automotive parts",
             "Construction materials"
-        ])
-        
-        # Nice classes (comma-separated, sometimes messy)
-        num_classes = random.randint(1, 3)
-        nice_classes = random.sample(NICE_CLASSES, num_classes)
-        nice_classes_str = ",".join(map(str, nice_classes))
-        if random.random() < 0.3:
-            nice_classes_str = nice_classes_str.replace(",", ", ")  # Add spaces sometimes
-        
-        vienna_classes = f"27.05.01, 26.01.03" if mark_type in ["logo", "combined", "design"] and random.random() < 0.5 else ""
-        
-        app_number = f"{random.randint(87, 90)}/{random.randint(100000, 999999)}"
-        reg_number = f"{random.randint(5000000, 7000000)}" if random.random() < 0.4 else ""
-        
-        filing_date = random_date(2018, 2023)
-        priority_date = random_date(2018, 2022) if random.random() < 0.4 else ""
-        pub_date = random_date(2019, 2024) if random.random() < 0.6 else ""
-        reg_date = random_date(2020, 2024) if random.random() < 0.4 else ""
-        renewal_date = random_date(2025, 2030) if reg_date else ""
-        expiry_date = random_date(2028, 2034) if reg_date else ""
-        
-        jurisdiction = random.choice(["US", "USA", "United States", "EU", "Europe", "GB", "DE", "JP", "CN"])
-        tm_office = {
-            "US": "USPTO", "USA": "USPTO", "United States": "USPTO",
-            "EU": "EUIPO", "Europe": "EUIPO",
-            "GB": "UKIPO", "DE": "DPMA", "JP": "JPO", "CN": "CNIPA"
-        }.get(jurisdiction, "USPTO")
-        
-        status = random.choice(["pending", "registered", "opposed", "cancelled", "abandoned", "expired", "published"])
-        
-        opposition_end = random_date(2024, 2025) if status == "published" and random.random() < 0.3 else ""
-        
-        use_basis = random.choice(["1(a)", "1(b)", "intent-to-use", "use-in-commerce", ""]) if jurisdiction in ["US", "USA", "United States"] else ""
-        first_use = random_date(2015, 2022) if use_basis in ["1(a)", "use-in-commerce"] and random.random() < 0.6 else ""
-        first_commerce = random_date(2016, 2023) if first_use and random.random() < 0.8 else ""
-        
-        estimated_cost = round(random.uniform(1000, 15000), 2) if random.random() < 0.8 else ""
-        actual_cost = round(random.uniform(800, 12000), 2) if random.random() < 0.6 else ""
-        
-        attorney_ref = f"ATT-{random.randint(1000, 9999)}" if random.random() < 0.7 else ""
-        internal_ref = f"TM-INT-{random.randint(1000, 9999)}" if random.random() < 0.8 else ""
-        
-        trademark = {
-            'tm_id': tm_id,
-            'client_id': client['client_id'],
-            'mark_text': mark_text,
-            'mark_type': mark_type,
-            'mark_description': mark_description,
-            'goods_services': goods_services,
-            'nice_classes': nice_classes_str,
-            'vienna_classes': vienna_classes,
-            'application_number': app_number,
-            'registration_number': reg_number,
-            'filing_date': filing_date,
-            'priority_date': priority_date,
-            'publication_date': pub_date,
-            'registration_date': reg_date,
-            'renewal_date': renewal_date,
-            'expiry_date': expiry_date,
-            'jurisdiction': jurisdiction,
-            'trademark_office': tm_office,
-            'status': status,
-            'opposition_period_end': opposition_end,
-            'use_basis': use_basis,
-            'first_use_date': first_use,
-            'first_use_commerce_date': first_commerce,
-            'attorney_ref': attorney_ref,
-            'internal_ref': internal_ref,
-            'estimated_cost': estimated_cost,
-            'actual_cost': actual_cost,
-            'created_on': random_date(2018, 2023),
-            'modified_on': random_date(2023, 2024) if random.random() < 0.5 else "",
-            'notes': "Legacy trademark record" if random.random() < 0.2 else ""
-        }
-        
-        trademarks.append(trademark)
-    
-    # Write to CSV
-    with open(OUTPUT_DIR / "trademarks.csv", 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=trademarks[0].keys())
-        writer.writeheader()
-        writer.writerows(trademarks)
-    
-    print(f"Generated {len(trademarks)} trademarks")
-    return trademarks
+        ], n),
+        'nice_classes': nice_classes,
+        'vienna_classes': np.where(is_figurative & chance(0.5, n), "27.05.01, 26.01.03", ""),
+        'application_number': [
+            f"{a}/{b}" for a, b in zip(rng.integers(87, 91, n), rng.integers(100000, 1000000, n))
+        ],
+        'registration_number': sometimes(prefixed_ids("", rng.integers(5000000, 7000001, n)), 0.4),
+        'filing_date': random_dates(n, 2018, 2023),
+        'priority_date': sometimes(random_dates(n, 2018, 2022), 0.4),
+        'publication_date': sometimes(random_dates(n, 2019, 2024), 0.6),
+        'registration_date': registration_date,
+        'renewal_date': np.where(is_registered, random_dates(n, 2025, 2030), ""),
+        'expiry_date': np.where(is_registered, random_dates(n, 2028, 2034), ""),
+        'jurisdiction': jurisdiction,
+        'trademark_office': tm_office,
+        'status': status,
+        'opposition_period_end': np.where((status == "published") & chance(0.3, n), random_dates(n, 2024, 2025), ""),
+        'use_basis': use_basis,
+        'first_use_date': first_use,
+        'first_use_commerce_date': first_commerce,
+        'attorney_ref': sometimes(prefixed_ids("ATT-", rng.integers(1000, 10000, n)), 0.7),
+        'internal_ref': sometimes(prefixed_ids("TM-INT-", rng.integers(1000, 10000, n)), 0.8),
+        'estimated_cost': costs(1000, 15000, n, 0.8),
+        'actual_cost': costs(800, 12000, n, 0.6),
+        'created_on': random_dates(n, 2018, 2023),
+        'modified_on': sometimes(random_dates(n, 2023, 2024), 0.5),
+        'notes': sometimes(np.full(n, "Legacy trademark record", dtype=object), 0.2)
+    }
+    print(f"Generated {n} trademarks")
+    return columns
 
 def generate_deadlines(clients, patents, trademarks):
     """Generate deadline data"""
     print("Generating deadlines...")
-    deadlines = []
+    seed_table("deadlines")
     
-    all_matters = (
-        [('patent', p) for p in patents] +
-        [('trademark', t) for t in trademarks]
+    matter_ids = np.concatenate([patents['patent_id'], trademarks['tm_id']])
+    matter_clients = np.concatenate([patents['client_id'], trademarks['client_id']])
+    matter_types = np.repeat(
+        np.array(['patent', 'trademark'], dtype=object),
+        [len(patents['patent_id']), len(trademarks['tm_id'])]
     )
     
-    deadline_id_counter = 1
-    
-    for matter_type, matter in all_matters:
-        # Generate 1-4 deadlines per matter
-        num_deadlines = random.randint(1, 4)
-        
-        for _ in range(num_deadlines):
-            deadline_id = f"DL-{str(deadline_id_counter).zfill(4)}"
-            deadline_id_counter += 1
-            
-            if matter_type == 'patent':
-                related_id = matter['patent_id']
-                client_id = matter['client_id']
-                deadline_types = ["renewal", "examination response", "filing", "annuity", "continuation"]
-            else:  # trademark
-                related_id = matter['tm_id']
-                client_id = matter['client_id']
-                deadline_types = ["renewal", "opposition response", "statement of use", "declaration", "maintenance"]
-            
-            deadline_type = random.choice(deadline_types)
-            
-            # Generate due date based on matter type and current date
-            if deadline_type == "renewal":
-                due_date = random_date(2024, 2030)
-            elif deadline_type in ["examination response", "opposition response"]:
-                due_date = random_date(2024, 2025)
-            else:
-                due_date = random_date(2024, 2027)
-            
-            description = f"{deadline_type.title()} for {matter_type} {related_id}"
-            if deadline_type == "renewal":
-                description += " - Fee payment required"
-            elif "response" in deadline_type:
-                description += " - Response to office action required"
-            
-            priority = random.choice(["low", "medium", "high", "critical", "urgent", "normal"])
-            status = random.choice(["pending", "completed", "overdue", "cancelled"])
-            
-            reminder_sent = random.choice(["yes", "no", "Y", "N", ""]) if status == "pending" else ""
-            completed_date = random_date(2023, 2024) if status == "completed" else ""
-            completed_by = f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}" if status == "completed" else ""
-            
-            cost = round(random.uniform(100, 5000), 2) if random.random() < 0.7 else ""
-            
-            deadline = {
-                'deadline_id': deadline_id,
-                'related_type': matter_type,
-                'related_id': related_id,
-                'client_id': client_id,
-                'deadline_type': deadline_type,
-                'due_date': due_date,
-                'description': description,
-                'priority': priority,
-                'status': status,
-                'reminder_sent': reminder_sent,
-                'completed_date': completed_date,
-                'completed_by': completed_by,
-                'cost': cost,
-                'internal_notes': "Legacy deadline record" if random.random() < 0.2 else "",
-                'created_on': random_date(2018, 2023),
-                'modified_on': random_date(2023, 2024) if random.random() < 0.5 else ""
-            }
-            
-            deadlines.append(deadline)
-    
-    # Write to CSV
-    with open(OUTPUT_DIR / "deadlines.csv", 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=deadlines[0].keys())
-        writer.writeheader()
-        writer.writerows(deadlines)
-    
-    print(f"Generated {len(deadlines)} deadlines")
-    return deadlines
-
-def main():
-    """Generate all mock data"""
+    # Generate 1-4 deadlines per matter
+    num_deadlines = rng.integers(1, 5, len(matter_ids))
+    related_type = np.repeat(matter_types, num_deadlines)
+    related_id = np.repeat(matter_ids, num_deadlines)
+    client_id = np.repeat(matter_clients, num_deadlines)
+    n = len(related_id)
+    
+    deadline_type = np.where(
+        related_type == 'patent',
+        choose(["renewal", "examination response", "filing", "annuity", "continuation"], n),
+        choose(["renewal", "opposition response", "statement of use", "declaration", "maintenance"], n)
+    )
+    is_renewal = deadline_type == "renewal"
+    is_response = np.isin(deadline_type, ["examination response", "opposition response"])
+    
+    # Generate due date based on matter type and current date
+    due_date = np.select(
+        [is_renewal, is_response],
+        [random_dates(n, 2024, 2030), random_dates(n, 2024, 2025)],
+        default=random_dates(n, 2024, 2027)
+    )
+    
+    description = [
+        f"{dtype.title()} for {mtype} {rid}"
+        + (" - Fee payment required" if dtype == "renewal" else
+           " - Response to office action required" if "response" in dtype else "")
+        for dtype, mtype, rid in zip(deadline_type, related_type, related_id)
+    ]
+    
+    status = choose(["pending", "completed", "overdue", "cancelled"], n)
+    is_completed = status == "completed"
+    
+    columns = {
+        'deadline_id': sequential_ids("DL-", n),
+        'related_type': related_type,
+        'related_id': related_id,
+        'client_id': client_id,
+        'deadline_type': deadline_type,
+        'due_date': due_date,
+        'description': description,
+        'priority': choose(["low", "medium", "high", "critical", "urgent", "normal"], n),
+        'status': status,
+        'reminder_sent': np.where(status == "pending", choose(["yes", "no", "Y", "N", ""], n), ""),
+        'completed_date': np.where(is_completed, random_dates(n, 2023, 2024), ""),
+        'completed_by': np.where(is_completed, choose(FIRST_NAMES, n) + " " + choose(LAST_NAMES, n), ""),
+        'cost': costs(100, 5000, n, 0.7),
+        'internal_notes': sometimes(np.full(n, "Legacy deadline record", dtype=object), 0.2),
+        'created_on': random_dates(n, 2018, 2023),
+        'modified_on': sometimes(random_dates(n, 2023, 2024), 0.5)
+    }
+    print(f"Generated {n} deadlines")
+    return columns
+
+def typed_column(values) -> pd.Series:
+    """A generated column with the dtype the web app reads back from its CSV
+
+    Blank and N/A-like cells are missing, all-missing columns are float NaN,
+    whole numbers are int64 (float64 when some are missing), other numbers
+    float64 and everything else text, as the app's pyarrow CSV reader infers
+    them.
+    """
+    if isinstance(values, np.ndarray) and values.dtype.kind == 'f':
+        return pd.Series(values)
+    
+    text = pd.Series(values, dtype=object)
+    blank = text.isin(MISSING_TEXT)
+    present = text[~blank].astype(str)
+    if present.empty:
+        return pd.Series(np.nan, index=text.index)
+    if present.str.fullmatch(NUMERIC_TEXT).all():
+        return pd.to_numeric(text.mask(blank, None))
+    return text.mask(blank, None).astype("str")
+
+def write_parquet_copies(tables: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Write a Parquet copy of each generated table next to its CSV for faster loading
+
+    The copies are built from the in-memory columns, typed like the web app
+    reads the CSVs, so either file loads to the same frame.
+    """
+    if pyarrow is None:
+        print("pyarrow not installed - skipping Parquet copies")
+        return []
+    
+    written = []
+    for filename, columns in tables.items():
+        parquet_path = (OUTPUT_DIR / filename).with_suffix(".parquet")
+        frame = pd.DataFrame({name: typed_column(values) for name, values in columns.items()})
+        categories = [name for name in CATEGORY_COLUMNS.get(filename, ()) if name in frame.columns]
+        frame = frame.astype(dict.fromkeys(categories, "category"))
+        frame.to_parquet(parquet_path, engine="pyarrow", index=False)
+        written.append(parquet_path.name)
+    
+    return written
+
+def main(parallel: bool = False):
+    """Generate all mock data
+
+    parallel=True (the command line) generates patents and trademarks in worker
+    processes; the web app calls this in-process, where forking is unsafe.
+    """
     print("Starting comprehensive mock data generation...")
     print(f"Output directory: {OUTPUT_DIR}")
     
     # Generate data in dependency order
     clients = generate_clients()
-    patents = generate_patents(clients)
-    trademarks = generate_trademarks(clients)
+    # Patents and trademarks only depend on clients, so they are generated
+    # in parallel worker processes when asked to and there is a spare core.
+    # Workers only need the columns that matters copy from their client.
+    if parallel and (os.cpu_count() or 1) > 1:
+        client_refs = {name: clients[name] for name in ('client_id', 'client_name')}
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            patents_future = executor.submit(generate_patents, client_refs)
+            trademarks_future = executor.submit(generate_trademarks, client_refs)
+            patents, trademarks = patents_future.result(), trademarks_future.result()
+    else:
+        patents = generate_patents(clients)
+        trademarks = generate_trademarks(clients)
     deadlines = generate_deadlines(clients, patents, trademarks)
     
+    tables = {
+        'clients.csv': clients,
+        'patents.csv': patents,
+        'trademarks.csv': trademarks,
+        'deadlines.csv': deadlines
+    }
+    # Write the CSVs concurrently; file writes release the GIL, so the
+    # threads overlap their disk I/O
+    with ThreadPoolExecutor(max_workers=len(tables)) as executor:
+        list(executor.map(write_csv, tables.values(), tables))
+    
+    csv_files = list(tables)
+    parquet_files = write_parquet_copies(tables)
+    
     # Generate summary
     summary = {
         'generation_date': datetime.now().isoformat(),
         'counts': {
-            'clients': len(clients),
-            'patents': len(patents),
-            'trademarks': len(trademarks),
-            'deadlines': len(deadlines)
+            'clients': len(clients['client_id']),
+            'patents': len(patents['patent_id']),
+            'trademarks': len(trademarks['tm_id']),
+            'deadlines': len(deadlines['deadline_id'])
         },
-        'files_generated': [
-            'clients.csv',
-            'patents.csv', 
-            'trademarks.csv',
-            'deadlines.csv'
-        ]
+        'files_generated': csv_files + parquet_files
     }
     
-    with open(OUTPUT_DIR / "generation_summary.json", 'w') as f:
+    with open(OUTPUT_DIR / "generation_summary.json", 'w', encoding='utf-8') as f:
         json.dump(summary, f, indent=2)
     
     print("\n" + "="*50)
@@ -663,4 +782,4 @@ def main():
     print("\nReady for ETL processing!")
 
 if __name__ == "__main__":
-    main()
+    main(parallel=True)
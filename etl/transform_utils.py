@@ -7,6 +7,7 @@ Handles data cleaning, normalization, and validation
 import re
 import json
 import logging
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple, Union
 from dateutil import parser as dateparser
 from datetime import datetime, date
@@ -61,6 +62,32 @@ STATUS_MAPPINGS = {
     }
 }
 
+# Placeholder strings legacy systems used for "no value"
+NULL_VALUES = ('n/a', 'na', 'null', 'none', 'unknown', 'tbd', 'pending')
+
+# Case-insensitive lookup tables (first spelling wins, as in the original scan)
+_COUNTRY_MAP_CI = {name.lower(): code for name, code in reversed(COUNTRY_MAP.items())}
+
+_STATUS_MAPPINGS_CI = {
+    etype: {norm: {v.lower() for v in variants} for norm, variants in mappings.items()}
+    for etype, mappings in STATUS_MAPPINGS.items()
+}
+
+# Inverted index (entity_type, variant) -> normalized status, first listed status wins
+_STATUS_INV = {
+    (etype, variant): norm
+    for etype, mappings in reversed(_STATUS_MAPPINGS_CI.items())
+    for norm, variants in reversed(mappings.items())
+    for variant in variants
+}
+
+# Precompiled patterns
+_WS_RE = re.compile(r'\s+')
+_SPLIT_RE = re.compile(r'[,;\s]+')
+_DIGITS_RE = re.compile(r'\d+')
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 # Priority mappings
 PRIORITY_MAP = {
     'low': ['low', 'minor', 'routine'],
@@ -69,6 +96,8 @@ PRIORITY_MAP = {
     'critical': ['critical', 'emergency', 'immediate', 'asap']
 }
 
+_PRIORITY_INV = {variant: norm for norm, variants in reversed(PRIORITY_MAP.items()) for variant in variants}
+
 def clean_string(value: Any) -> str:
     """Clean and normalize string values"""
     if pd.isna(value) or value is None:
@@ -78,10 +107,10 @@ def clean_string(value: Any) -> str:
     cleaned = str(value).strip()
     
     # Remove multiple spaces
-    cleaned = re.sub(r'\s+', ' ', cleaned)
+    cleaned = _WS_RE.sub(' ', cleaned)
     
     # Handle common legacy data issues
-    if cleaned.lower() in ['n/a', 'na', 'null', 'none', 'unknown', 'tbd', 'pending']:
+    if cleaned.lower() in NULL_VALUES:
         return ""
     
     return cleaned
@@ -101,12 +130,12 @@ def iso2(country_raw: str) -> Optional[str]:
         return result
     
     # Case-insensitive lookup
-    for key, value in COUNTRY_MAP.items():
-        if key.lower() == country_clean.lower():
-            return value
+    country_lower = country_clean.lower()
+    result = _COUNTRY_MAP_CI.get(country_lower)
+    if result:
+        return result
     
     # Partial match for common variations
-    country_lower = country_clean.lower()
     if 'united states' in country_lower or 'america' in country_lower:
         return 'US'
     elif 'united kingdom' in country_lower or 'britain' in country_lower:
@@ -126,6 +155,11 @@ def to_date(value: Any, default_format: str = None) -> Optional[str]:
     if not date_str:
         return None
     
+    return _parse_date(date_str)
+
+@lru_cache(maxsize=1 << 17)
+def _parse_date(date_str: str) -> Optional[str]:
+    """Parse one cleaned date string; cached because legacy extracts repeat dates heavily"""
     # Handle obviously bad dates
     bad_dates = ['00/00/0000', '1900-01-01', '0000-00-00', '01/01/1900']
     if date_str in bad_dates:
@@ -147,6 +181,17 @@ def to_date(value: Any, default_format: str = None) -> Optional[str]:
     
     return None
 
+def parse_date_series(values: pd.Series) -> pd.Series:
+    """Column-wise to_date as datetime64: one pd.to_datetime call, NaT wherever to_date returns None"""
+    try:
+        parsed = pd.to_datetime(values, errors='coerce', format='mixed', cache=True)
+    except (ValueError, TypeError):
+        # e.g. mixed UTC offsets; fall back to the (cached) per-value parser
+        return pd.to_datetime(values.map(to_date), errors='coerce', format='%Y-%m-%d')
+    # 1900-01-01 is the legacy "no date" placeholder to_date also rejects
+    invalid = (parsed.dt.year < 1900) | (parsed.dt.year > 2050) | (parsed == pd.Timestamp(1900, 1, 1))
+    return parsed.mask(invalid)
+
 def split_name(name: str) -> Dict[str, str]:
     """Split name into first and last name components"""
     if not name:
@@ -195,7 +240,7 @@ def parse_classes(value: Any) -> List[int]:
     # Extract numbers from string
     numbers = []
     # Split by common separators
-    parts = re.split(r'[,;\s]+', classes_str)
+    parts = _SPLIT_RE.split(classes_str)
     
     for part in parts:
         part = part.strip()
@@ -205,7 +250,7 @@ def parse_classes(value: Any) -> List[int]:
                 numbers.append(num)
         else:
             # Try to extract numbers from mixed content
-            digits = re.findall(r'\d+', part)
+            digits = _DIGITS_RE.findall(part)
             for digit in digits:
                 num = int(digit)
                 if 1 <= num <= 45:
@@ -222,18 +267,16 @@ def normalize_status(status: str, entity_type: str) -> str:
     if not status_clean:
         return 'pending'
     
-    # Get mappings for entity type
-    mappings = STATUS_MAPPINGS.get(entity_type, {})
-    
-    # Find matching normalized status
-    for normalized, variants in mappings.items():
-        if status_clean in [v.lower() for v in variants]:
-            return normalized
+    # Exact variant match
+    normalized = _STATUS_INV.get((entity_type, status_clean))
+    if normalized:
+        return normalized
     
     # If no match found, try partial matching
+    mappings = _STATUS_MAPPINGS_CI.get(entity_type, {})
     for normalized, variants in mappings.items():
         for variant in variants:
-            if variant.lower() in status_clean or status_clean in variant.lower():
+            if variant in status_clean or status_clean in variant:
                 return normalized
     
     logger.warning(f"Unknown {entity_type} status: {status}")
@@ -249,9 +292,9 @@ def normalize_priority(priority: str) -> str:
         return 'medium'
     
     # Find matching normalized priority
-    for normalized, variants in PRIORITY_MAP.items():
-        if priority_clean in variants:
-            return normalized
+    normalized = _PRIORITY_INV.get(priority_clean)
+    if normalized:
+        return normalized
     
     logger.warning(f"Unknown priority: {priority}")
     return 'medium'
@@ -271,7 +314,7 @@ def parse_phone(phone: str) -> str:
         return ""
     
     # Extract digits only
-    digits = re.sub(r'[^\d]', '', phone_clean)
+    digits = _NON_DIGIT_RE.sub('', phone_clean)
     
     # Validate length (US format)
     if len(digits) == 10:
@@ -295,19 +338,24 @@ def parse_email(email: str) -> str:
         return ""
     
     # Basic email validation
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if re.match(email_pattern, email_clean):
+    if _EMAIL_RE.match(email_clean):
         return email_clean
     
     # Try to fix common issues
     if '_at_' in email_clean:
         email_clean = email_clean.replace('_at_', '@')
-        if re.match(email_pattern, email_clean):
+        if _EMAIL_RE.match(email_clean):
             return email_clean
     
     logger.warning(f"Invalid email format: {email}")
     return ""
 
+def valid_email_mask(emails: pd.Series) -> pd.Series:
+    """Column-wise parse_email: True where parse_email would return an address"""
+    cleaned = emails.fillna('').astype(str).str.strip().str.lower()
+    fixed = cleaned.str.replace('_at_', '@', regex=False)
+    return cleaned.str.match(_EMAIL_RE) | fixed.str.match(_EMAIL_RE)
+
 def parse_inventors(inventors_str: str) -> List[Dict[str, str]]:
     """Parse inventor string into structured data"""
     if not inventors_str:
@@ -394,6 +442,11 @@ def calculate_expiry_date(filing_date: str, jurisdiction: str, ip_type: str) ->
     
     return expiry_dt.date().isoformat()
 
+def _count_invalid_dates(values: pd.Series) -> int:
+    """Count non-empty values that to_date would reject, parsing the column in one call"""
+    present = values.notna() & (values.astype(str).str.strip() != "")
+    return int((present & parse_date_series(values.where(present)).isna()).sum())
+
 def validate_data_quality(df: pd.DataFrame, entity_type: str) -> Dict[str, Any]:
     """Validate data quality and return quality metrics"""
     total_rows = len(df)
@@ -430,7 +483,7 @@ def validate_data_quality(df: pd.DataFrame, entity_type: str) -> Dict[str, Any]:
         
         # Validate emails
         if 'email' in df.columns:
-            valid_emails = df['email'].apply(lambda x: bool(parse_email(x)) if x else False).sum()
+            valid_emails = int(valid_email_mask(df['email']).sum())
             invalid_emails = total_rows - valid_emails
             quality_metrics["invalid_emails"] = invalid_emails
             if invalid_emails > 0:
@@ -450,9 +503,7 @@ def validate_data_quality(df: pd.DataFrame, entity_type: str) -> Dict[str, Any]:
         date_fields = ['filing_date', 'grant_date', 'registration_date']
         for field in date_fields:
             if field in df.columns:
-                invalid_dates = df[field].apply(
-                    lambda x: to_date(x) is None if x else False
-                ).sum()
+                invalid_dates = _count_invalid_dates(df[field])
                 quality_metrics["invalid_dates"] += invalid_dates
                 if invalid_dates > 0:
                     issues.append(f"{invalid_dates} invalid {field} values")
@@ -481,8 +532,8 @@ def split_name_legacy(name: str) -> str:
 
 # Export commonly used functions
 __all__ = [
-    'clean_string', 'iso2', 'to_date', 'split_name', 'parse_classes',
-    'normalize_status', 'normalize_priority', 'parse_phone', 'parse_email',
+    'clean_string', 'iso2', 'to_date', 'parse_date_series', 'split_name', 'parse_classes',
+    'normalize_status', 'normalize_priority', 'parse_phone', 'parse_email', 'valid_email_mask',
     'parse_inventors', 'parse_json_field', 'calculate_expiry_date',
     'validate_data_quality', 'split_name_legacy'
 ]
@@ -7,14 +7,27 @@ Validates data quality, business rules, and referential integrity
 import os
 import json
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
 import pandas as pd
 from datetime import datetime, date
 
+try:
+    import pyarrow
+    import pyarrow.compute
+except ImportError:
+    pyarrow = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from transform_utils import (
     validate_data_quality, to_date, iso2, parse_email, 
-    parse_phone, normalize_status, parse_classes
+    parse_phone, normalize_status, parse_classes, valid_email_mask, parse_date_series
 )
 
 # Configure logging
@@ -26,6 +39,60 @@ DATA_DIR = ROOT / "data" / "legacy_csv"
 VALIDATION_REPORT_DIR = ROOT / "data" / "validation_reports"
 VALIDATION_REPORT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Columns the quality metrics and rules look at; everything else in an extract is skipped
+VALIDATION_COLUMNS = {
+    "clients": ["client_id", "client_name", "email", "external_ref"],
+    "patents": ["patent_id", "client_id", "title", "status", "filing_date", "grant_date",
+                "registration_date", "external_ref"],
+    "trademarks": ["tm_id", "client_id", "title", "status", "nice_classes", "filing_date",
+                   "grant_date", "registration_date", "external_ref"],
+    "deadlines": ["deadline_id", "client_id", "status", "due_date", "external_ref"],
+}
+# Extracts at least this large are validated in chunks instead of being loaded whole
+STREAM_MIN_BYTES = 256 * 1024 * 1024
+# Rows per chunk when streaming a large extract
+CHUNK_ROWS = 100_000
+# Only this many errors per check are spelled out in a report; error_count keeps the exact total
+MAX_DETAILED_ERRORS = 100
+
+
+def _merge_quality_metrics(parts: List[Dict[str, Any]], duplicates: int) -> Dict[str, Any]:
+    """Combine per-chunk quality metrics into the metrics for the whole file"""
+    counters = ["total_rows", "complete_records", "missing_critical_fields", "invalid_dates", "invalid_emails"]
+    merged = {name: sum(int(part.get(name, 0)) for part in parts) for name in counters}
+    if merged["total_rows"] == 0:
+        return {"total_rows": 0, "quality_score": 0, "issues": []}
+    merged["duplicate_records"] = duplicates
+    
+    # Issues read "<count> <description>"; add the counts up per description
+    issue_counts: Dict[str, int] = {}
+    for part in parts:
+        for issue in part.get("issues", []):
+            count, description = issue.split(" ", 1)
+            issue_counts[description] = issue_counts.get(description, 0) + int(count)
+    issue_counts.pop("duplicate external references found", None)
+    issues = [f"{duplicates} duplicate external references found"] if duplicates > 0 else []
+    issues.extend(f"{count} {description}" for description, count in issue_counts.items())
+    
+    total_issues = (merged["missing_critical_fields"] + merged["invalid_dates"] +
+                    merged["invalid_emails"] + duplicates)
+    merged["quality_score"] = round(max(0, 100 - (total_issues / merged["total_rows"] * 100)), 2)
+    merged["issues"] = issues
+    return merged
+
+
+def _report_default(value: Any) -> Any:
+    """orjson fallback matching json.dump(default=str): float subclasses stay numbers"""
+    return float(value) if isinstance(value, float) else str(value)
+
+
+def _validate_entity(file_path: Path, entity_type: str, valid_client_ids: Optional[pd.Index]) -> Dict[str, Any]:
+    """Validate one file in a worker process, reusing the parent's client-id set"""
+    validator = IPMSDataValidator()
+    validator._valid_client_ids = valid_client_ids
+    return validator.validate_file(file_path, entity_type)
+
+
 class IPMSDataValidator:
     """Comprehensive data validator for IPMS migration"""
     
@@ -33,6 +100,100 @@ class IPMSDataValidator:
         self.validation_results = {}
         self.errors = []
         self.warnings = []
+        self._valid_client_ids: Optional[pd.Index] = None
+        self._frames: Dict[Tuple[Path, str], pd.DataFrame] = {}
+    
+    def _read_kwargs(self, file_path: Path, entity_type: str) -> Dict[str, Any]:
+        """read_csv arguments that load only the validated columns, as strings"""
+        wanted = VALIDATION_COLUMNS.get(entity_type)
+        if wanted is None:
+            return {}
+        header = pd.read_csv(file_path, nrows=0).columns
+        usecols = [c for c in header if c in wanted]
+        return {"usecols": usecols, "dtype": dict.fromkeys(usecols, str)}
+    
+    def _load_frame(self, file_path: Path, entity_type: str) -> pd.DataFrame:
+        """Read only the validated columns as strings, with PyArrow when available"""
+        key = (file_path.resolve(), entity_type)
+        if key in self._frames:
+            return self._frames[key]
+        
+        kwargs = self._read_kwargs(file_path, entity_type)
+        if pyarrow is not None:
+            kwargs["engine"] = "pyarrow"
+        else:
+            # the PyArrow engine does its own I/O; the C parser can read straight from the page cache
+            kwargs["memory_map"] = True
+        
+        df = pd.read_csv(file_path, **kwargs)
+        self._frames[key] = df
+        return df
+    
+    def _validate_frame(self, df: pd.DataFrame, entity_type: str):
+        """Run the quality, business-rule and referential checks on one frame"""
+        # The checks only read df and are mostly pandas calls that release the GIL
+        if (os.cpu_count() or 1) > 1:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                quality = executor.submit(validate_data_quality, df, entity_type)
+                business = executor.submit(self._validate_business_rules, df, entity_type)
+                ref = executor.submit(self._validate_referential_integrity, df, entity_type)
+                return quality.result(), business.result(), ref.result()
+        
+        quality_metrics = validate_data_quality(df, entity_type)
+        business_validation = self._validate_business_rules(df, entity_type)
+        ref_validation = self._validate_referential_integrity(df, entity_type)
+        return quality_metrics, business_validation, ref_validation
+    
+    def _validate_chunks(self, file_path: Path, entity_type: str):
+        """Validate a large extract chunk by chunk, so memory follows CHUNK_ROWS rather than file size"""
+        record_count = 0
+        duplicates = 0
+        seen_refs: set = set()
+        seen_missing = False
+        quality_parts = []
+        business_errors, business_warnings, business_error_count = [], [], 0
+        ref_errors, ref_warnings, ref_error_count = [], [], 0
+        ref_status, references_checked = "skipped", 0
+        
+        reader = pd.read_csv(file_path, chunksize=CHUNK_ROWS, memory_map=True,
+                             **self._read_kwargs(file_path, entity_type))
+        for chunk in reader:
+            record_count += len(chunk)
+            quality, business, ref = self._validate_frame(chunk, entity_type)
+            quality_parts.append(quality)
+            business_errors.extend(business["errors"][:MAX_DETAILED_ERRORS - len(business_errors)])
+            business_warnings.extend(business["warnings"])
+            business_error_count += business["error_count"]
+            ref_errors.extend(ref["errors"][:MAX_DETAILED_ERRORS - len(ref_errors)])
+            ref_warnings.extend(ref["warnings"])
+            ref_error_count += ref["error_count"]
+            ref_status = ref["status"]
+            references_checked += ref["references_checked"]
+            
+            # duplicates can span chunks, so count them against every earlier chunk too
+            if 'external_ref' in chunk.columns:
+                refs = chunk['external_ref']
+                missing = refs.isna().to_numpy()
+                earlier = np.fromiter(map(seen_refs.__contains__, refs), dtype=bool, count=len(refs))
+                duplicates += int((refs.duplicated().to_numpy() | earlier | (missing & seen_missing)).sum())
+                seen_refs.update(refs[~missing])
+                seen_missing = seen_missing or bool(missing.any())
+        
+        business_validation = {
+            "status": "completed",
+            "errors": business_errors,
+            "error_count": business_error_count,
+            "warnings": business_warnings,
+            "rules_checked": business_error_count + len(business_warnings)
+        }
+        ref_validation = {
+            "status": ref_status,
+            "errors": ref_errors,
+            "error_count": ref_error_count,
+            "warnings": ref_warnings,
+            "references_checked": references_checked
+        }
+        return record_count, _merge_quality_metrics(quality_parts, duplicates), business_validation, ref_validation
     
     def validate_file(self, file_path: Path, entity_type: str) -> Dict[str, Any]:
         """Validate a single CSV file"""
@@ -50,24 +211,29 @@ class IPMSDataValidator:
             }
         
         try:
-            # Load data
-            df = pd.read_csv(file_path)
-            
-            # Basic data quality validation
-            quality_metrics = validate_data_quality(df, entity_type)
-            
-            # Business rule validation
-            business_validation = self._validate_business_rules(df, entity_type)
-            
-            # Referential integrity validation
-            ref_validation = self._validate_referential_integrity(df, entity_type)
+            file_size = file_path.stat().st_size
+            df = self._load_frame(file_path, entity_type) if 0 < file_size < STREAM_MIN_BYTES else None
+            if file_size == 0 or (df is not None and df.empty):
+                # Nothing to check, so skip the quality, business-rule and referential passes
+                record_count = 0
+                quality_metrics = {"total_rows": 0, "quality_score": 0, "issues": []}
+                business_validation = {"status": "skipped", "errors": [], "error_count": 0,
+                                       "warnings": [], "rules_checked": 0}
+                ref_validation = {"status": "skipped", "errors": [], "error_count": 0,
+                                  "warnings": [], "references_checked": 0}
+            elif df is None:
+                record_count, quality_metrics, business_validation, ref_validation = \
+                    self._validate_chunks(file_path, entity_type)
+            else:
+                record_count = len(df)
+                quality_metrics, business_validation, ref_validation = self._validate_frame(df, entity_type)
             
             # Combine results
             validation_result = {
                 "entity_type": entity_type,
                 "file_path": str(file_path),
                 "status": "success",
-                "record_count": len(df),
+                "record_count": record_count,
                 "quality_metrics": quality_metrics,
                 "business_validation": business_validation,
                 "referential_validation": ref_validation,
@@ -92,130 +258,186 @@ class IPMSDataValidator:
         """Validate business-specific rules"""
         errors = []
         warnings = []
+        error_count = 0
+        
+        # Deadline rules key off the status; lowercase it once for all of them
+        if entity_type == "deadlines" and 'status' in df.columns:
+            df = df.assign(_status_lc=df['status'].str.lower())
         
-        if entity_type == "clients":
-            errors.extend(self._validate_client_business_rules(df))
-        elif entity_type == "patents":
-            errors.extend(self._validate_patent_business_rules(df))
-        elif entity_type == "trademarks":
-            errors.extend(self._validate_trademark_business_rules(df))
-        elif entity_type == "deadlines":
-            errors.extend(self._validate_deadline_business_rules(df))
+        rules = self._RULE_DISPATCH.get(entity_type)
+        if rules is not None:
+            errors, error_count = rules(self, df)
         
         return {
             "status": "completed",
             "errors": errors,
+            "error_count": error_count,
             "warnings": warnings,
-            "rules_checked": len(errors) + len(warnings)
+            "rules_checked": error_count + len(warnings)
         }
     
-    def _validate_client_business_rules(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def _validate_client_business_rules(self, df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], int]:
         """Validate client-specific business rules"""
         errors = []
+        error_count = 0
         
         # Rule: Email format validation for non-empty emails
-        for idx, row in df.iterrows():
-            email = row.get('email', '')
-            if email and not parse_email(email):
-                errors.append({
-                    "rule": "Email format validation",
-                    "record_id": row.get('client_id', idx),
-                    "message": f"Invalid email format: {email}"
-                })
-        
-        return errors
+        if 'email' in df.columns:
+            emails = df['email'].fillna('').astype(str)
+            invalid = emails.ne('') & ~valid_email_mask(emails)
+            error_count = int(invalid.sum())
+            bad = df.loc[invalid].head(MAX_DETAILED_ERRORS)
+            record_ids = bad['client_id'] if 'client_id' in bad.columns else bad.index
+            errors = [{
+                "rule": "Email format validation",
+                "record_id": record_id,
+                "message": f"Invalid email format: {email}"
+            } for record_id, email in zip(record_ids, bad['email'])]
+        
+        return errors, error_count
     
-    def _validate_patent_business_rules(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def _validate_patent_business_rules(self, df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], int]:
         """Validate patent-specific business rules"""
         errors = []
+        error_count = 0
         
         # Rule: Filing date should be before grant date
-        for idx, row in df.iterrows():
-            filing_date = to_date(row.get('filing_date'))
-            grant_date = to_date(row.get('grant_date'))
-            
-            if filing_date and grant_date:
-                if filing_date > grant_date:
-                    errors.append({
-                        "rule": "Filing date before grant date",
-                        "record_id": row.get('patent_id', idx),
-                        "message": f"Filing date ({filing_date}) is after grant date ({grant_date})"
-                    })
-        
-        return errors
+        if {'filing_date', 'grant_date'} <= set(df.columns):
+            filing = parse_date_series(df['filing_date'])
+            grant = parse_date_series(df['grant_date'])
+            bad = filing.notna() & grant.notna() & (filing > grant)
+            error_count = int(bad.sum())
+            record_ids = df.loc[bad, 'patent_id'] if 'patent_id' in df.columns else df.index[bad]
+            filing, grant = filing[bad].head(MAX_DETAILED_ERRORS), grant[bad].head(MAX_DETAILED_ERRORS)
+            errors = [{
+                "rule": "Filing date before grant date",
+                "record_id": record_id,
+                "message": f"Filing date ({filing_date}) is after grant date ({grant_date})"
+            } for record_id, filing_date, grant_date in zip(
+                record_ids, filing.dt.strftime('%Y-%m-%d'), grant.dt.strftime('%Y-%m-%d'))]
+        
+        return errors, error_count
     
-    def _validate_trademark_business_rules(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def _validate_trademark_business_rules(self, df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], int]:
         """Validate trademark-specific business rules"""
         errors = []
+        error_count = 0
         
         # Rule: Nice classes should be valid
-        for idx, row in df.iterrows():
-            nice_classes = row.get('nice_classes', '')
-            if nice_classes:
-                classes = parse_classes(nice_classes)
-                if not classes:
-                    errors.append({
-                        "rule": "Valid Nice classes required",
-                        "record_id": row.get('tm_id', idx),
-                        "message": f"Invalid Nice classes: {nice_classes}"
-                    })
-        
-        return errors
+        if 'nice_classes' in df.columns:
+            values = df['nice_classes'].fillna('').astype(str)
+            non_empty = values.ne('')
+            # a row is valid when any digit run is a class 1-45 (what parse_classes keeps)
+            runs = values[non_empty].str.extractall(r'(\d+)')[0].str.lstrip('0')
+            in_range = pd.to_numeric(runs.where(runs.str.len() <= 2), errors='coerce').between(1, 45)
+            has_class = in_range.groupby(level=0).any().reindex(df.index, fill_value=False).astype(bool)
+            invalid = non_empty & ~has_class
+            error_count = int(invalid.sum())
+            bad = df.loc[invalid].head(MAX_DETAILED_ERRORS)
+            record_ids = bad['tm_id'] if 'tm_id' in bad.columns else bad.index
+            errors = [{
+                "rule": "Valid Nice classes required",
+                "record_id": record_id,
+                "message": f"Invalid Nice classes: {nice_classes}"
+            } for record_id, nice_classes in zip(record_ids, bad['nice_classes'])]
+        
+        return errors, error_count
     
-    def _validate_deadline_business_rules(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def _validate_deadline_business_rules(self, df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], int]:
         """Validate deadline-specific business rules"""
         errors = []
+        error_count = 0
         
         # Rule: Due date should be in the future for pending deadlines
-        current_date = date.today().isoformat()
-        pending_deadlines = df[df['status'].str.lower() == 'pending']
-        
-        for idx, row in pending_deadlines.iterrows():
-            due_date = to_date(row.get('due_date'))
-            if due_date and due_date < current_date:
-                errors.append({
-                    "rule": "Pending deadline due date validation",
-                    "record_id": row.get('deadline_id', idx),
-                    "message": f"Pending deadline has past due date: {due_date}"
-                })
-        
-        return errors
+        today = pd.Timestamp(date.today())
+        status = df['_status_lc'] if '_status_lc' in df.columns else df['status'].str.lower()
+        pending = status.eq('pending')
+        due = parse_date_series(df['due_date'].where(pending))
+        overdue = pending & due.notna() & (due < today)
+        error_count = int(overdue.sum())
+        
+        record_ids = df.loc[overdue, 'deadline_id'] if 'deadline_id' in df.columns else df.index[overdue]
+        due = due[overdue].head(MAX_DETAILED_ERRORS)
+        for deadline_id, due_date in zip(record_ids, due.dt.strftime('%Y-%m-%d')):
+            errors.append({
+                "rule": "Pending deadline due date validation",
+                "record_id": deadline_id,
+                "message": f"Pending deadline has past due date: {due_date}"
+            })
+        
+        return errors, error_count
+    
+    _RULE_DISPATCH = {
+        "clients": _validate_client_business_rules,
+        "patents": _validate_patent_business_rules,
+        "trademarks": _validate_trademark_business_rules,
+        "deadlines": _validate_deadline_business_rules,
+    }
     
     def _validate_referential_integrity(self, df: pd.DataFrame, entity_type: str) -> Dict[str, Any]:
         """Validate referential integrity between entities"""
         errors = []
         warnings = []
+        error_count = 0
         
-        # Load all client IDs for reference checking
-        clients_file = DATA_DIR / "clients.csv"
-        if clients_file.exists():
-            clients_df = pd.read_csv(clients_file)
-            valid_client_ids = set(clients_df['client_id'].astype(str))
-            
-            # Check client_id references
-            if 'client_id' in df.columns:
-                invalid_client_refs = df[~df['client_id'].isin(valid_client_ids)]
-                for idx, row in invalid_client_refs.iterrows():
-                    errors.append({
-                        "rule": "Valid client reference",
-                        "record_id": row.get(f"{entity_type[:-1]}_id", idx),
-                        "message": f"Invalid client_id reference: {row['client_id']}"
-                    })
+        # Clients cannot dangle against themselves; entities without client_id have nothing to check
+        if entity_type == "clients" or 'client_id' not in df.columns:
+            return {"status": "skipped", "errors": errors, "error_count": 0, "warnings": warnings,
+                    "references_checked": 0}
+        
+        # Check client_id references
+        # Missing or blank client_id is a missing value, not a dangling reference
+        client_ids = df['client_id'].dropna().astype(str)
+        client_ids = client_ids[client_ids.str.strip().ne('')]
+        references_checked = len(client_ids)
+        
+        valid_client_ids = self._get_valid_client_ids()
+        if valid_client_ids is not None:
+            if pyarrow is not None:
+                # pandas boxes every lookup value for Arrow strings; probe Arrow's hash set directly
+                found = pyarrow.compute.is_in(pyarrow.array(client_ids), value_set=pyarrow.array(valid_client_ids))
+                found = found.to_numpy(zero_copy_only=False)
+            else:
+                found = client_ids.isin(valid_client_ids).to_numpy()
+            invalid = pd.Series(False, index=df.index)
+            invalid[client_ids.index[~found]] = True
+            error_count = int(invalid.sum())
+            bad = df.loc[invalid].head(MAX_DETAILED_ERRORS)
+            id_col = f"{entity_type[:-1]}_id"
+            record_ids = bad[id_col] if id_col in bad.columns else bad.index
+            errors = [{
+                "rule": "Valid client reference",
+                "record_id": record_id,
+                "message": f"Invalid client_id reference: {client_id}"
+            } for record_id, client_id in zip(record_ids, bad['client_id'])]
         
         return {
             "status": "completed",
             "errors": errors,
+            "error_count": error_count,
             "warnings": warnings,
-            "references_checked": len(df) if 'client_id' in df.columns else 0
+            "references_checked": references_checked
         }
     
+    def _get_valid_client_ids(self) -> Optional[pd.Index]:
+        """Load all client IDs, as a string Index, for reference checking (once per validator)"""
+        clients_file = DATA_DIR / "clients.csv"
+        # Only a frame read from DATA_DIR/clients.csv is the client master list
+        clients = self._frames.get((clients_file.resolve(), "clients"))
+        if self._valid_client_ids is None and clients is not None and "client_id" in clients:
+            self._valid_client_ids = pd.Index(clients['client_id'].dropna().astype(str)).unique()
+        elif self._valid_client_ids is None and clients_file.exists():
+            client_ids = pd.read_csv(clients_file, usecols=['client_id'], dtype=str, memory_map=True)['client_id']
+            self._valid_client_ids = pd.Index(client_ids.dropna().astype(str)).unique()
+        return self._valid_client_ids
+    
     def _calculate_overall_score(self, quality_metrics: Dict, business_validation: Dict) -> float:
         """Calculate overall validation score"""
         quality_score = quality_metrics.get('quality_score', 0)
         
         # Business rules score
         business_score = 100
-        business_errors = len(business_validation.get('errors', []))
+        business_errors = business_validation.get('error_count', len(business_validation.get('errors', [])))
         if business_errors > 0:
             business_score = max(0, 100 - (business_errors * 5))
         
@@ -223,8 +445,12 @@ class IPMSDataValidator:
         overall_score = (quality_score * 0.7 + business_score * 0.3)
         return round(overall_score, 2)
     
-    def validate_all(self) -> Dict[str, Any]:
-        """Validate all data files"""
+    def validate_all(self, parallel: bool = False) -> Dict[str, Any]:
+        """Validate all data files
+
+        With parallel=True (the command line), files after clients are validated in
+        worker processes. Servers leave it off: forking a threaded process can deadlock.
+        """
         logger.info("Starting comprehensive data validation")
         
         files_to_validate = [
@@ -237,11 +463,25 @@ class IPMSDataValidator:
         results = {}
         overall_scores = []
         
-        for filename, entity_type in files_to_validate:
-            file_path = DATA_DIR / filename
-            result = self.validate_file(file_path, entity_type)
-            results[entity_type] = result
-            
+        # Clients go first so the other entities share one client-id set
+        (clients_file, _), *rest = files_to_validate
+        results["clients"] = self.validate_file(DATA_DIR / clients_file, "clients")
+        valid_client_ids = self._get_valid_client_ids()
+        
+        # The remaining files are independent, so use worker processes when cores allow
+        if parallel and (os.cpu_count() or 1) > 1:
+            with ProcessPoolExecutor(max_workers=min(4, len(rest))) as executor:
+                futures = {
+                    executor.submit(_validate_entity, DATA_DIR / filename, entity_type, valid_client_ids): entity_type
+                    for filename, entity_type in rest
+                }
+                done = {futures[future]: future.result() for future in as_completed(futures)}
+            results.update((entity_type, done[entity_type]) for _, entity_type in rest)
+        else:
+            for filename, entity_type in rest:
+                results[entity_type] = self.validate_file(DATA_DIR / filename, entity_type)
+        
+        for result in results.values():
             if result.get('overall_score'):
                 overall_scores.append(result['overall_score'])
         
@@ -266,8 +506,12 @@ class IPMSDataValidator:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_file = VALIDATION_REPORT_DIR / f"validation_report_{timestamp}.json"
         
-        with open(report_file, 'w') as f:
-            json.dump(validation_summary, f, indent=2, default=str)
+        if orjson is not None:
+            report_file.write_bytes(orjson.dumps(validation_summary, default=_report_default,
+                                                option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_file, 'w') as f:
+                json.dump(validation_summary, f, indent=2, default=str)
         
         logger.info(f"Validation report saved to {report_file}")
 
@@ -279,7 +523,7 @@ def main():
     validator = IPMSDataValidator()
     
     try:
-        validation_results = validator.validate_all()
+        validation_results = validator.validate_all(parallel=True)
         
         print(f"\nValidation Results:")
         print(f"System Quality Score: {validation_results['system_quality_score']}/100")
@@ -307,8 +551,9 @@ def main():
                 print(f"  Business Rule Violations:")
                 for error in business['errors'][:5]:  # Show first 5
                     print(f"    - {error.get('message', 'Unknown error')}")
-                if len(business['errors']) > 5:
-                    print(f"    ... and {len(business['errors']) - 5} more")
+                error_count = business.get('error_count', len(business['errors']))
+                if error_count > 5:
+                    print(f"    ... and {error_count - 5} more")
         
         print(f"\nValidation report saved to: {VALIDATION_REPORT_DIR}")
         
@@ -0,0 +1,197 @@
+import asyncio
+import json
+import os
+import shutil
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+
+
+def _clear_caches():
+    main._TABLE_CACHE.clear()
+    main._COUNTS_CACHE.clear()
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """A private copy of the legacy CSVs, so tests never touch data/"""
+    for name in ("clients.csv", "patents.csv", "trademarks.csv", "deadlines.csv"):
+        shutil.copy(main.DATA_DIR / name, tmp_path / name)
+    monkeypatch.setattr(main, "DATA_DIR", tmp_path)
+    _clear_caches()
+    yield tmp_path
+    _clear_caches()
+
+
+@pytest.fixture
+def client(data_dir):
+    # no lifespan: API tests need neither templates nor the bytecode cache
+    return TestClient(main.app)
+
+
+def _deadline_ids(client, **params):
+    response = client.get("/api/deadlines", params={"limit": 100_000, **params})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == len(body["deadlines"])
+    return [row["deadline_id"] for row in body["deadlines"]]
+
+
+def test_urgency_filter_overdue(client, data_dir):
+    deadlines = pd.read_csv(data_dir / "deadlines.csv")
+    urgency, _ = main.classify_deadline_urgency(deadlines["due_date"])
+    expected = deadlines.loc[urgency == "overdue", "deadline_id"].tolist()
+    assert expected
+    assert _deadline_ids(client, urgency="overdue") == expected
+
+
+def test_urgency_filter_rejects_unknown_level(client):
+    response = client.get("/api/deadlines", params={"urgency": "bogus"})
+    assert response.status_code == 400
+
+
+def test_urgency_buckets_match_classifier_row_by_row(client, data_dir):
+    deadlines = pd.read_csv(data_dir / "deadlines.csv")
+    urgency, _ = main.classify_deadline_urgency(deadlines["due_date"])
+    expected = dict(zip(deadlines["deadline_id"], urgency))
+    labelled = {
+        deadline_id: level
+        for level in main.URGENCY_LEVELS
+        for deadline_id in _deadline_ids(client, urgency=level)
+    }
+    assert labelled == expected
+
+
+def _parse(content):
+    """Strict JSON parse: bare NaN/Infinity is not JSON"""
+    def reject(constant):
+        raise ValueError(f"invalid JSON constant {constant}")
+    return json.loads(content, parse_constant=reject)
+
+
+def _expected_window(data_dir, filename, offset, limit):
+    """What the endpoints returned before streaming: a sliced to_dict('records')"""
+    frame = main._read_data_file(data_dir / filename)
+    records = frame.iloc[offset:offset + limit].astype(object)
+    records = records.where(records.notna(), None).to_dict("records")
+    return _parse(main._dumps(records))
+
+
+@pytest.mark.parametrize("offset,limit", [(0, 100), (37, 5), (250, 1500), (0, 100_000), (10_000, 10)])
+def test_list_endpoint_windows_match_slicing(client, data_dir, offset, limit):
+    response = client.get("/api/patents", params={"offset": offset, "limit": limit})
+    assert response.status_code == 200
+    body = _parse(response.content)
+    assert isinstance(body["patents"], list)
+    assert body["patents"] == _expected_window(data_dir, "patents.csv", offset, limit)
+    assert (body["total"], body["offset"], body["limit"]) == (
+        len(pd.read_csv(data_dir / "patents.csv")), offset, limit)
+
+
+def test_list_endpoint_limit_zero_is_empty(client):
+    body = _parse(client.get("/api/clients", params={"limit": 0}).content)
+    assert body["clients"] == []
+    assert body["total"] > 0
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    """Run a test with orjson and with the stdlib json fallback"""
+    if request.param == "json":
+        monkeypatch.setattr(main, "orjson", None)
+    return request.param
+
+
+def test_dumps_writes_non_finite_floats_as_null(encoder):
+    value = {"a": float("nan"), "b": [np.float64("inf"), np.int64(3)], "c": "x"}
+    assert _parse(main._dumps(value)) == {"a": None, "b": [None, 3], "c": "x"}
+
+
+def test_list_endpoint_writes_nan_as_null(client, data_dir, encoder):
+    clients = pd.read_csv(data_dir / "clients.csv")
+    missing = clients["company_name"].isna()
+    assert missing.any()
+    body = _parse(client.get("/api/clients", params={"limit": len(clients)}).content)
+    assert [row["company_name"] is None for row in body["clients"]] == missing.tolist()
+
+
+def _rewrite_keeping_stat(path, frame):
+    """Replace a data file with another of the same size and mtime"""
+    stat = path.stat()
+    frame.to_csv(path, index=False)
+    assert path.stat().st_size == stat.st_size
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def test_regeneration_clears_pages_and_urgency_index(client, data_dir, monkeypatch):
+    deadlines = pd.read_csv(data_dir / "deadlines.csv", dtype=str, keep_default_na=False)
+    first = client.get("/api/deadlines", params={"limit": 5}).json()["deadlines"]
+    assert _deadline_ids(client, urgency="overdue")
+
+    # Same rows in reverse order and every deadline moved far into the future
+    regenerated = deadlines.iloc[::-1].assign(due_date="2999-01-01")
+    monkeypatch.setattr(main, "generate_data",
+                        lambda: _rewrite_keeping_stat(data_dir / "deadlines.csv", regenerated))
+    asyncio.run(main.run_data_generation_background())
+    assert main._TABLE_CACHE == {}
+
+    page = client.get("/api/deadlines", params={"limit": 5}).json()["deadlines"]
+    assert [row["deadline_id"] for row in page] == regenerated["deadline_id"].head(5).tolist()
+    assert page != first
+    assert _deadline_ids(client, urgency="overdue") == []
+
+
+def test_parquet_sibling_with_same_mtime_is_not_served_from_csv_cache(client, data_dir):
+    client.get("/api/deadlines", params={"limit": 5})
+    assert _deadline_ids(client, urgency="overdue")
+
+    parquet_path = data_dir / "deadlines.parquet"
+    future = main._read_data_file(data_dir / "deadlines.csv").assign(due_date="2999-01-01")
+    future.to_parquet(parquet_path, index=False)
+    stat = (data_dir / "deadlines.csv").stat()
+    os.utime(parquet_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert _deadline_ids(client, urgency="overdue") == []
+
+
+@pytest.mark.skipif(main.pyarrow is None or main.generate_data is None,
+                    reason="needs pyarrow and the ETL modules")
+@pytest.mark.parametrize("filename", ["clients.csv", "patents.csv", "trademarks.csv", "deadlines.csv"])
+def test_parquet_copy_reads_like_its_csv(tmp_path, monkeypatch, filename):
+    generator = sys.modules[main.generate_data.__module__]
+    monkeypatch.setattr(generator, "OUTPUT_DIR", tmp_path)
+    for name, count in [("NUM_CLIENTS", 50), ("NUM_PATENTS", 120), ("NUM_TRADEMARKS", 80)]:
+        monkeypatch.setattr(generator, name, count)
+    main.generate_data()
+
+    csv_path = tmp_path / filename
+    pd.testing.assert_frame_equal(main._read_data_file(csv_path),
+                                  main._read_data_file(csv_path.with_suffix(".parquet")))
+
+
+def test_report_cache_keeps_only_listed_reports(tmp_path, monkeypatch, request):
+    monkeypatch.setattr(main, "VALIDATION_REPORTS_DIR", tmp_path)
+    request.addfinalizer(main._validation_report_files.cache_clear)
+    monkeypatch.setattr(main, "_REPORT_CACHE", {})
+    reports = []
+    for i in range(main.MAX_LISTED_REPORTS + 3):
+        report_file = tmp_path / f"validation_report_{i:02d}.json"
+        report_file.write_text(json.dumps({"run": i}))
+        os.utime(report_file, ns=(i * 10**9, i * 10**9))
+        reports.append(report_file)
+
+    main._validation_report_files.cache_clear()
+    assert len(main._load_validation_reports()) == main.MAX_LISTED_REPORTS
+    assert set(main._REPORT_CACHE) == set(reports[3:])
+
+    for report_file in reports[-2:]:
+        report_file.unlink()
+    main._validation_report_files.cache_clear()
+    assert main._load_latest_validation_report() == {"run": len(reports) - 3}
+    assert set(main._REPORT_CACHE) <= set(reports[1:-2])
+    assert not set(main._REPORT_CACHE) & set(reports[-2:])
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, text
+import etl.migrate as migrate
+from etl.migrate import _copy_csv, _on_conflict, _tally_returning, upsert_dataframe
+
+def test_copy_csv_writes_nan_promoted_ids_as_integers():
+    df = pd.DataFrame({
+        "external_ref": ["a", "b", "c"],
+        "related_id": [12.0, np.nan, 7.0],
+        "cost": [1.5, np.nan, 2.0],
+        "classes": [[1, 10], [], None],
+    })
+    assert _copy_csv(df).read().splitlines() == [
+        'a,12,1.5,"{1,10}"',
+        "b,,,{}",
+        "c,7,2.0,",
+    ]
+
+def test_upsert_dataframe_batches_and_maps_ids(monkeypatch):
+    # 300 bind parameters per statement -> 100-row batches
+    monkeypatch.setattr(migrate, "MAX_BIND_PARAMS", 300)
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY, external_ref TEXT UNIQUE, a TEXT, b INTEGER)"))
+        df = pd.DataFrame({"external_ref": [f"X{i}" for i in range(250)], "a": "v", "b": range(250)})
+        inserted, updated, ids = upsert_dataframe(conn, df, "t", "external_ref", ["a", "b"])
+        assert (inserted, updated) == (250, 0)
+        assert len(ids) == 250 and ids["X0"] == 1 and ids["X249"] == 250
+
+        # duplicate keys keep the last row; existing rows keep their ids
+        again = pd.concat([df.iloc[:3], df.iloc[[1]].assign(a="last")])
+        _, _, ids = upsert_dataframe(conn, again, "t", "external_ref", ["a", "b"])
+        assert ids == {"X0": 1, "X2": 3, "X1": 2}
+        assert conn.execute(text("SELECT count(*), max(a) FROM t")).one() == (250, "v")
+        assert conn.execute(text("SELECT a FROM t WHERE external_ref = 'X1'")).scalar() == "last"
+
+def test_upsert_counts_come_from_xmax():
+    assert _on_conflict("external_ref", ("a",)).endswith("RETURNING id, external_ref, (xmax = 0)")
+    assert _tally_returning([(1, "X0", True), (2, "X1", False), (3, "X2", True)]) == (2, 1, {"X0": 1, "X1": 2, "X2": 3})
@@ -0,0 +1,72 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# validate.py imports its helpers as a top-level module, the way it runs from etl/
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "etl"))
+import validate
+
+ENTITIES = ["clients", "patents", "trademarks", "deadlines"]
+
+def _summary(result):
+    quality = dict(result["quality_metrics"])
+    quality["issues"] = sorted(quality["issues"])
+    return {
+        "record_count": result["record_count"],
+        "quality_metrics": {k: v if isinstance(v, list) else float(v) for k, v in quality.items()},
+        "business_errors": result["business_validation"]["error_count"],
+        "business_detail": result["business_validation"]["errors"],
+        "ref_errors": result["referential_validation"]["error_count"],
+        "overall_score": result["overall_score"],
+    }
+
+def _validate(path, entity_type, monkeypatch, stream):
+    if stream:
+        monkeypatch.setattr(validate, "STREAM_MIN_BYTES", 1)
+        monkeypatch.setattr(validate, "CHUNK_ROWS", 37)
+    result = validate.IPMSDataValidator().validate_file(path, entity_type)
+    assert result["status"] == "success", result.get("error")
+    return _summary(result)
+
+@pytest.mark.parametrize("entity_type", ENTITIES)
+def test_chunked_validation_matches_whole_file(entity_type, monkeypatch):
+    path = validate.DATA_DIR / f"{entity_type}.csv"
+    whole = _validate(path, entity_type, monkeypatch, stream=False)
+    assert _validate(path, entity_type, monkeypatch, stream=True) == whole
+
+def test_chunked_validation_counts_duplicates_across_chunks(tmp_path, monkeypatch):
+    refs = ["r1", "r2", None] * 30 + ["r3"] * 5
+    path = tmp_path / "clients.csv"
+    pd.DataFrame({
+        "client_id": [f"C{i}" for i in range(len(refs))],
+        "client_name": "Acme",
+        "email": "ops@acme.com",
+        "external_ref": refs,
+    }).to_csv(path, index=False)
+    whole = _validate(path, "clients", monkeypatch, stream=False)
+    assert whole["quality_metrics"]["duplicate_records"] == len(refs) - 4
+    assert _validate(path, "clients", monkeypatch, stream=True) == whole
+
+@pytest.mark.parametrize("use_arrow", [True, False])
+def test_missing_client_ids_are_not_dangling_references(use_arrow, monkeypatch):
+    if not use_arrow:
+        monkeypatch.setattr(validate, "pyarrow", None)
+    df = pd.DataFrame({"patent_id": ["P1", "P2", "P3", "P4"], "client_id": ["CL-0001", "CL-9999", None, " "]})
+    result = validate.IPMSDataValidator()._validate_referential_integrity(df, "patents")
+    assert result["references_checked"] == 2
+    assert result["error_count"] == 1
+    assert [e["record_id"] for e in result["errors"]] == ["P2"]
+
+def test_frame_cache_is_keyed_by_path(tmp_path):
+    other = tmp_path / "clients.csv"
+    pd.DataFrame({"client_id": ["ZZ-1"], "client_name": ["Other"], "email": ["a@b.co"]}).to_csv(other, index=False)
+    validator = validate.IPMSDataValidator()
+    assert validator.validate_file(other, "clients")["record_count"] == 1
+    real = validator.validate_file(validate.DATA_DIR / "clients.csv", "clients")
+    assert real["record_count"] == len(pd.read_csv(validate.DATA_DIR / "clients.csv"))
+    # a clients file outside DATA_DIR never becomes the reference list
+    fresh = validate.IPMSDataValidator()
+    fresh.validate_file(other, "clients")
+    assert "ZZ-1" not in fresh._get_valid_client_ids()